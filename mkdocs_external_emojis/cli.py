@@ -1,7 +1,11 @@
 """Command-line interface for emoji management."""
 
+import heapq
 import json
 import sys
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, TypeVar
 
 import click
 
@@ -12,8 +16,92 @@ from mkdocs_external_emojis.config import (
     load_config,
     validate_environment,
 )
-from mkdocs_external_emojis.providers import ProviderError, create_provider
-from mkdocs_external_emojis.sync import EmojiCache, SyncManager
+from mkdocs_external_emojis.constants import MAX_PROVIDER_WORKERS
+from mkdocs_external_emojis.models import EmojiConfig, ProviderConfig, SyncResult
+
+# Providers and sync pull in requests and Pillow, so commands import them on
+# first use to keep `mkdocs-emoji --help` and config-only commands fast.
+if TYPE_CHECKING:
+    from mkdocs_external_emojis.providers import AbstractEmojiProvider, ProviderError
+    from mkdocs_external_emojis.sync import SyncManager
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _map_providers(func: Callable[[_T], _R], items: Sequence[_T]) -> "Sequence[_R | ProviderError]":
+    """
+    Run a provider call for each item concurrently.
+
+    Args:
+        func: Callable making the (network-bound) provider request
+        items: Items to call func with
+
+    Returns:
+        Results in input order, with a ProviderError in place of any failed call
+    """
+    from mkdocs_external_emojis.providers import ProviderError
+
+    def call(item: _T) -> "_R | ProviderError":
+        try:
+            return func(item)
+        except ProviderError as e:
+            return e
+
+    if len(items) <= 1:
+        return [call(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(len(items), MAX_PROVIDER_WORKERS)) as executor:
+        # Unpack instead of list(): the builtin is shadowed by the `list` command below
+        return [*executor.map(call, items)]
+
+
+def _select_providers(emoji_config: EmojiConfig, namespace: str | None) -> Sequence[ProviderConfig]:
+    """
+    Get the enabled providers, narrowed to a single namespace if one is given.
+
+    Args:
+        emoji_config: Emoji configuration
+        namespace: Optional provider namespace from --provider
+
+    Returns:
+        Matching enabled providers (empty if the namespace is unknown or disabled)
+    """
+    if not namespace:
+        return emoji_config.get_enabled_providers()
+
+    provider_config = emoji_config.get_provider_by_namespace(namespace)
+    if provider_config is None or not provider_config.enabled:
+        return []
+    return [provider_config]
+
+
+def _sync_with_progress(
+    sync_manager: "SyncManager", provider: "AbstractEmojiProvider", force: bool
+) -> SyncResult:
+    """
+    Sync a single provider while drawing a progress bar.
+
+    Args:
+        sync_manager: Sync manager to run the sync with
+        provider: Provider to sync
+        force: Force re-download even if cached
+
+    Returns:
+        Sync result with statistics
+    """
+    with click.progressbar(length=100, label=f"  {provider.config.namespace}") as bar:
+        next_update = 0  # Emoji count at which the bar advances to the next percent
+
+        def progress(name: str, current: int, total: int) -> None:
+            nonlocal next_update
+            if current < next_update:
+                return
+            percent = (current * 100) // total
+            bar.update(percent - bar.pos)
+            next_update = -(-(percent + 1) * total // 100)  # ceil division
+
+        return sync_manager.sync_provider(provider, force=force, progress_callback=progress)
 
 
 @click.group()
@@ -48,6 +136,9 @@ def main() -> None:
 )
 def sync(config: str, provider: str | None, force: bool, dry_run: bool) -> None:
     """Sync emojis from configured providers."""
+    from mkdocs_external_emojis.providers import ProviderError, create_provider
+    from mkdocs_external_emojis.sync import SyncManager
+
     try:
         emoji_config = load_config(config)
     except ConfigError as e:
@@ -70,19 +161,40 @@ def sync(config: str, provider: str | None, force: bool, dry_run: bool) -> None:
     )
 
     # Filter providers if specific one requested
-    providers_to_sync = emoji_config.get_enabled_providers()
-    if provider:
-        providers_to_sync = [p for p in providers_to_sync if p.namespace == provider]
-        if not providers_to_sync:
-            click.echo(f"Error: Provider '{provider}' not found", err=True)
-            sys.exit(1)
+    providers_to_sync = _select_providers(emoji_config, provider)
+    if provider and not providers_to_sync:
+        click.echo(f"Error: Provider '{provider}' not found", err=True)
+        sys.exit(1)
+
+    def create(provider_config: ProviderConfig) -> "AbstractEmojiProvider | ProviderError":
+        try:
+            return create_provider(provider_config)
+        except ProviderError as e:
+            return e
+
+    # Create providers up front; failures are reported in place below
+    providers = (
+        [] if dry_run else [create(provider_config) for provider_config in providers_to_sync]
+    )
 
-    # Sync each provider
+    # Several providers sync concurrently; a lone one gets a progress bar instead
+    ready = [p for p in providers if not isinstance(p, ProviderError)]
+    outcomes: dict[AbstractEmojiProvider, SyncResult | ProviderError] = {}
+    if len(ready) > 1:
+        outcomes = dict(
+            zip(
+                ready,
+                _map_providers(lambda p: sync_manager.sync_provider(p, force=force), ready),
+                strict=True,
+            )
+        )
+
+    # Report each provider in config order
     total_synced = 0
     total_cached = 0
     total_errors = 0
 
-    for provider_config in providers_to_sync:
+    for i, provider_config in enumerate(providers_to_sync):
         click.echo(
             f"Syncing {provider_config.type.value} (namespace: {provider_config.namespace})..."
         )
@@ -91,37 +203,29 @@ def sync(config: str, provider: str | None, force: bool, dry_run: bool) -> None:
             click.echo("  [DRY RUN] Would sync emojis")
             continue
 
-        # Create provider
-        try:
-            provider_instance = create_provider(provider_config)
-        except ProviderError as e:
-            click.echo(f"  Error: {e}", err=True)
+        provider_instance = providers[i]
+        if isinstance(provider_instance, ProviderError):
+            outcome = provider_instance
+        elif provider_instance in outcomes:
+            outcome = outcomes[provider_instance]
+        else:
+            outcome = _sync_with_progress(sync_manager, provider_instance, force)
+
+        if isinstance(outcome, ProviderError):
+            click.echo(f"  Error: {outcome}", err=True)
             total_errors += 1
             continue
 
-        # Sync
-        with click.progressbar(
-            length=100,
-            label=f"  {provider_config.namespace}",
-        ) as bar:
-
-            def progress(name: str, current: int, total: int) -> None:
-                bar.update((current * 100) // total - bar.pos)
-
-            result = sync_manager.sync_provider(
-                provider_instance,
-                force=force,
-                progress_callback=progress,
-            )
-
-        click.echo(f"  ✓ Synced {result.synced}, cached {result.cached}, skipped {result.skipped}")
+        click.echo(
+            f"  ✓ Synced {outcome.synced}, cached {outcome.cached}, skipped {outcome.skipped}"
+        )
 
-        total_synced += result.synced
-        total_cached += result.cached
-        total_errors += len(result.errors)
+        total_synced += outcome.synced
+        total_cached += outcome.cached
+        total_errors += len(outcome.errors)
 
-        if result.errors:
-            click.echo(f"  ⚠ {len(result.errors)} errors occurred")
+        if outcome.errors:
+            click.echo(f"  ⚠ {len(outcome.errors)} errors occurred")
 
     click.echo(f"\nTotal: {total_synced} synced, {total_cached} cached, {total_errors} errors")
 
@@ -152,6 +256,8 @@ def sync(config: str, provider: str | None, force: bool, dry_run: bool) -> None:
 )
 def list(config: str, provider: str | None, search: str | None, format: str) -> None:
     """List available emojis."""
+    from mkdocs_external_emojis.providers import ProviderError, create_provider
+
     try:
         emoji_config = load_config(config)
     except ConfigError as e:
@@ -170,46 +276,55 @@ def list(config: str, provider: str | None, search: str | None, format: str) ->
     # Fetch emojis from providers
     all_emojis: dict[str, dict[str, str]] = {}
 
-    providers_to_list = emoji_config.get_enabled_providers()
-    if provider:
-        providers_to_list = [p for p in providers_to_list if p.namespace == provider]
+    providers_to_list = _select_providers(emoji_config, provider)
 
+    # Create providers
+    provider_instances = []
     for provider_config in providers_to_list:
-        # Create provider
         try:
-            provider_instance = create_provider(provider_config)
+            provider_instances.append(create_provider(provider_config))
         except ProviderError as e:
             click.echo(f"Error: {e}", err=True)
-            continue
 
-        # Fetch emojis
-        try:
-            emojis = provider_instance.fetch_emojis()
-            namespace_emojis: dict[str, str] = {}
+    # Fetch emojis from all providers concurrently
+    fetched = _map_providers(lambda p: p.fetch_emojis(), provider_instances)
 
-            for name, info in emojis.items():
-                # Apply search filter
-                if search and search.lower() not in name.lower():
-                    continue
+    # Loop invariants for the per-emoji filter below
+    search_lower = search.lower() if search else None
+    format_emoji_name = emoji_config.emojis.format_emoji_name
 
-                emoji_name = emoji_config.emojis.format_emoji_name(provider_config.namespace, name)
-                namespace_emojis[emoji_name] = info.url or ""
+    for provider_instance, emojis in zip(provider_instances, fetched, strict=True):
+        namespace = provider_instance.config.namespace
 
-            all_emojis[provider_config.namespace] = namespace_emojis
+        if isinstance(emojis, ProviderError):
+            click.echo(f"Error fetching from {namespace}: {emojis}", err=True)
+            continue
 
-        except ProviderError as e:
-            click.echo(f"Error fetching from {provider_config.namespace}: {e}", err=True)
+        namespace_emojis: dict[str, str] = {}
+
+        for name, info in emojis.items():
+            # Apply search filter
+            if search_lower and search_lower not in name.lower():
+                continue
+
+            emoji_name = format_emoji_name(namespace, name)
+            namespace_emojis[emoji_name] = info.url or ""
+
+        all_emojis[namespace] = namespace_emojis
 
     # Output
     if format == "json":
         click.echo(json.dumps(all_emojis, indent=2))
-    else:
+    elif all_emojis:
+        # Build the listing up front so it goes out in a single write
+        lines = []
         for namespace, emoji_dict in all_emojis.items():
-            click.echo(f"\n{namespace} ({len(emoji_dict)} emojis):")
-            for name in sorted(emoji_dict.keys())[:50]:  # Show first 50
-                click.echo(f"  :{name}:")
+            lines.append(f"\n{namespace} ({len(emoji_dict)} emojis):")
+            # Show first 50 alphabetically without sorting the whole namespace
+            lines.extend(f"  :{name}:" for name in heapq.nsmallest(50, emoji_dict))
             if len(emoji_dict) > 50:
-                click.echo(f"  ... and {len(emoji_dict) - 50} more")
+                lines.append(f"  ... and {len(emoji_dict) - 50} more")
+        click.echo("\n".join(lines))
 
 
 @main.command()
@@ -259,17 +374,19 @@ def validate(config: str, check_env: bool, test_providers: bool) -> None:
 
     # Test providers
     if test_providers:
+        from mkdocs_external_emojis.providers import ProviderError, create_provider
+
         click.echo("\nTesting provider connections...")
 
-        for provider_config in providers:
-            try:
-                provider_instance = create_provider(provider_config)
-                emoji_count = provider_instance.validate_config()
+        results = _map_providers(lambda p: create_provider(p).validate_config(), providers)
+
+        for provider_config, emoji_count in zip(providers, results, strict=True):
+            if isinstance(emoji_count, ProviderError):
+                click.echo(f"✗ {provider_config.namespace}: {emoji_count}", err=True)
+            else:
                 click.echo(
                     f"✓ {provider_config.namespace}: Connection successful - found {emoji_count} emojis"
                 )
-            except ProviderError as e:
-                click.echo(f"✗ {provider_config.namespace}: {e}", err=True)
 
     click.echo("\n✓ Validation complete")
 
@@ -288,15 +405,15 @@ def validate(config: str, check_env: bool, test_providers: bool) -> None:
 )
 def cache(config: str, provider: str | None) -> None:
     """Show cache information."""
+    from mkdocs_external_emojis.sync import EmojiCache
+
     try:
         emoji_config = load_config(config)
     except ConfigError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
 
-    providers_to_check = emoji_config.get_enabled_providers()
-    if provider:
-        providers_to_check = [p for p in providers_to_check if p.namespace == provider]
+    providers_to_check = _select_providers(emoji_config, provider)
 
     for provider_config in providers_to_check:
         cache_instance = EmojiCache(emoji_config.cache, provider_config.namespace)
@@ -1,10 +1,18 @@
 """Configuration loading and validation."""
 
+import copy
 import os
+import re
 import tomllib
 import warnings
+from collections.abc import Mapping
 from pathlib import Path
 
+try:  # Prefer the Rust-backed parser when the "fast" extra is installed
+    import rtoml as _toml
+except ImportError:
+    _toml = tomllib
+
 from mkdocs_external_emojis.constants import DEFAULT_CONFIG_FILE
 from mkdocs_external_emojis.models import EmojiConfig, ProviderConfig
 
@@ -15,6 +23,13 @@ class ConfigError(Exception):
     pass
 
 
+# Alphanumerics, dashes and underscores, with at least one alphanumeric character
+_NAMESPACE_RE = re.compile(r"[\w-]*[^\W_][\w-]*")
+
+# Parsed configs keyed by absolute path, tagged with the (mtime_ns, size, inode) they were read at
+_config_cache: dict[str, tuple[tuple[int, int, int], EmojiConfig]] = {}
+
+
 def load_config(config_path: Path | str = DEFAULT_CONFIG_FILE) -> EmojiConfig:
     """
     Load emoji configuration from TOML file.
@@ -23,20 +38,38 @@ def load_config(config_path: Path | str = DEFAULT_CONFIG_FILE) -> EmojiConfig:
         config_path: Path to the TOML configuration file
 
     Returns:
-        Parsed and validated EmojiConfig
+        Parsed and validated EmojiConfig. Repeat loads of an unchanged file
+        reuse the cached parse but return a fresh copy, so callers may modify it.
 
     Raises:
         ConfigError: If config file is invalid or missing
     """
     config_file = Path(config_path)
 
-    if not config_file.exists():
-        raise ConfigError(f"Configuration file not found: {config_file}")
+    try:
+        st = config_file.stat()
+    except FileNotFoundError:
+        raise ConfigError(f"Configuration file not found: {config_file}") from None
+    except OSError as e:
+        raise ConfigError(f"Failed to read {config_file}: {e}") from e
+
+    cache_key = str(config_file.absolute())
+    stat_key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _config_cache.get(cache_key)
+    if cached is not None and cached[0] == stat_key:
+        # Environment variables may have changed since the file was parsed
+        env = os.environ
+        for provider in cached[1].providers:
+            _validate_provider(provider, env)
+        return copy.deepcopy(cached[1])
 
     try:
-        with open(config_file, "rb") as f:
-            data = tomllib.load(f)
-    except tomllib.TOMLDecodeError as e:
+        data = _toml.loads(config_file.read_text(encoding="utf-8"))
+    except UnicodeDecodeError as e:
+        # Subclasses ValueError, so it must be caught before the TOML syntax errors
+        raise ConfigError(f"Failed to read {config_file}: not valid UTF-8 ({e})") from e
+    except ValueError as e:
+        # tomllib.TOMLDecodeError and rtoml.TomlParsingError both subclass ValueError
         raise ConfigError(f"Invalid TOML syntax in {config_file}: {e}") from e
     except Exception as e:
         raise ConfigError(f"Failed to read {config_file}: {e}") from e
@@ -54,18 +87,22 @@ def load_config(config_path: Path | str = DEFAULT_CONFIG_FILE) -> EmojiConfig:
         raise ConfigError(f"Invalid configuration: {e}") from e
 
     # Validate each provider
+    env = os.environ
     for provider in config.providers:
-        _validate_provider(provider)
+        _validate_provider(provider, env)
 
+    # Keep a private copy so edits made by the caller never reach later loads
+    _config_cache[cache_key] = (stat_key, copy.deepcopy(config))
     return config
 
 
-def _validate_provider(provider: ProviderConfig) -> None:
+def _validate_provider(provider: ProviderConfig, env: Mapping[str, str] | None = None) -> None:
     """
     Validate a provider configuration.
 
     Args:
         provider: Provider configuration to validate
+        env: Environment to check token variables against (defaults to os.environ)
 
     Raises:
         ConfigError: If provider config is invalid
@@ -76,7 +113,7 @@ def _validate_provider(provider: ProviderConfig) -> None:
         raise ConfigError("Namespace cannot be empty")
     if len(namespace) > 64:
         raise ConfigError(f"Namespace '{namespace}' is too long (max 64 characters)")
-    if not namespace.replace("-", "").replace("_", "").isalnum():
+    if not _NAMESPACE_RE.fullmatch(namespace):
         raise ConfigError(
             f"Invalid namespace '{namespace}': "
             "must contain only alphanumeric characters, dashes, and underscores"
@@ -87,7 +124,9 @@ def _validate_provider(provider: ProviderConfig) -> None:
         raise ConfigError(f"Provider '{provider.namespace}' missing token_env")
 
     # Check if environment variable exists (warning, not error)
-    if not os.getenv(provider.token_env):
+    if env is None:
+        env = os.environ
+    if not env.get(provider.token_env):
         warnings.warn(
             f"Environment variable '{provider.token_env}' not set for "
             f"provider '{provider.namespace}'. The build will fail if this "
@@ -107,11 +146,12 @@ def validate_environment(config: EmojiConfig) -> list[str]:
     Returns:
         List of missing environment variable names
     """
-    missing = []
-    for provider in config.get_enabled_providers():
-        if not os.getenv(provider.token_env):
-            missing.append(provider.token_env)
-    return missing
+    env = os.environ
+    return [
+        provider.token_env
+        for provider in config.get_enabled_providers()
+        if not env.get(provider.token_env)
+    ]
 
 
 def create_default_config(path: Path | str = DEFAULT_CONFIG_FILE) -> None:
@@ -2,3 +2,12 @@
 
 LOGGER_NAME = "mkdocs.plugins.external-emojis"
 DEFAULT_CONFIG_FILE = "emoji-config.toml"
+
+# Upper bound on providers queried concurrently
+MAX_PROVIDER_WORKERS = 8
+
+# Upper bound on concurrent emoji image downloads
+MAX_DOWNLOAD_WORKERS = 16
+
+# Seconds a provider's emoji list is reused before the API is asked again
+PROVIDER_RESPONSE_MAX_AGE = 300
@@ -1,9 +1,11 @@
 """Custom emoji index for pymdownx.emoji integration."""
 
 import logging
+import os
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 from xml.etree.ElementTree import Element
 
 from material.extensions.emoji import to_svg, twemoji
@@ -19,6 +21,38 @@ logger = logging.getLogger(LOGGER_NAME)
 _MD_CONFIG_ATTR = "_external_emoji_config"
 
 
+class _CustomEmojiEntry(Mapping[str, str]):
+    """
+    Read-only emoji index entry for a custom emoji.
+
+    Behaves like the {"name", "unicode", "category"} dict pymdownx.emoji expects,
+    but only the name is stored per instance; the placeholder fields are shared.
+    """
+
+    __slots__ = ("name",)
+
+    # Use a placeholder Unicode (U+E000 is in Private Use Area)
+    _SHARED: ClassVar[dict[str, str]] = {"unicode": "e000", "category": "custom"}
+    _KEYS: ClassVar[tuple[str, ...]] = ("name", "unicode", "category")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __getitem__(self, key: str) -> str:
+        if key == "name":
+            return self.name
+        return self._SHARED[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
 @dataclass
 class EmojiIndexConfig:
     """Configuration for the emoji index."""
@@ -27,6 +61,137 @@ class EmojiIndexConfig:
     emoji_paths: dict[str, str] = field(default_factory=dict)
 
 
+@dataclass
+class _CustomEntries:
+    """Index entries built from one scan of the icons directory."""
+
+    # (namespace, directory mtime in nanoseconds) pairs the entries were built from
+    signature: tuple[tuple[str, int], ...]
+    emoji_paths: dict[str, str]
+    emoji: dict[str, _CustomEmojiEntry]
+
+
+# Entries keyed by (icons directory, namespace_prefix_required). MkDocs creates a
+# Markdown instance, and so a new emoji index, for every page; rebuilding the
+# entries is only needed when a namespace directory's file list changes.
+_entries_cache: dict[tuple[str, bool], _CustomEntries] = {}
+
+
+def _scan_namespaces(icons_dir: Path) -> list[os.DirEntry[str]]:
+    """
+    List the namespace directories under the icons directory, in name order.
+
+    Args:
+        icons_dir: Path to custom icons directory
+
+    Returns:
+        Directory entries of the namespaces (empty if icons_dir doesn't exist)
+    """
+    try:
+        namespace_iter = os.scandir(icons_dir)
+    except FileNotFoundError:
+        return []
+
+    with namespace_iter:
+        return sorted(
+            (entry for entry in namespace_iter if entry.is_dir()), key=lambda entry: entry.name
+        )
+
+
+def _scan_emoji_files(namespace_dir: str) -> list[str]:
+    """
+    List the emoji file names in a namespace directory.
+
+    Uses os.scandir so is_file() comes from the directory listing instead of a
+    stat() call per entry. Hidden files are skipped.
+
+    Args:
+        namespace_dir: Path to the namespace directory
+
+    Returns:
+        Emoji file names
+    """
+    with os.scandir(namespace_dir) as emoji_iter:
+        return [
+            emoji_entry.name
+            for emoji_entry in emoji_iter
+            if not emoji_entry.name.startswith(".") and emoji_entry.is_file()
+        ]
+
+
+def _get_custom_entries(icons_dir: Path, namespace_prefix_required: bool) -> _CustomEntries:
+    """
+    Get the custom emoji entries for an icons directory, rescanning only if it changed.
+
+    A directory's mtime changes whenever a file is added to, removed from or
+    renamed in it, so entries are reused while every namespace directory keeps
+    the mtime it had when they were built.
+
+    Args:
+        icons_dir: Path to custom icons directory
+        namespace_prefix_required: Whether namespace prefix is required
+
+    Returns:
+        Emoji paths and index entries for every custom emoji
+    """
+    namespace_entries = _scan_namespaces(icons_dir)
+    signature = tuple((entry.name, entry.stat().st_mtime_ns) for entry in namespace_entries)
+
+    cache_key = (str(icons_dir), namespace_prefix_required)
+    cached = _entries_cache.get(cache_key)
+    if cached is not None and cached.signature == signature:
+        return cached
+
+    emoji_paths: dict[str, str] = {}
+    emoji_map: dict[str, _CustomEmojiEntry] = {}
+    # Namespace that owns each unprefixed name
+    unprefixed_owners: dict[str, str] = {}
+
+    for namespace_entry in namespace_entries:
+        namespace = namespace_entry.name
+        # Namespace-invariant parts of the paths and names built below
+        rel_prefix = f"assets/emojis/{namespace}/"
+        name_prefix = f"{namespace}-"
+
+        for file_name in _scan_emoji_files(namespace_entry.path):
+            # Get emoji name without extension
+            dot = file_name.rfind(".")
+            emoji_name = file_name if dot == -1 else file_name[:dot]
+
+            # Store relative path for the generator to use
+            rel_path = rel_prefix + file_name
+
+            # Add with namespace prefix (e.g., :slack-partyparrot:)
+            full_name = name_prefix + emoji_name
+            emoji_paths[full_name] = rel_path
+            emoji_map[f":{full_name}:"] = _CustomEmojiEntry(full_name)
+
+            # Also add without prefix (e.g., :partyparrot:) unless namespace prefix is required
+            if namespace_prefix_required:
+                continue
+
+            # The first namespace to claim an unprefixed name keeps it
+            owner = unprefixed_owners.setdefault(emoji_name, namespace)
+            if owner != namespace:
+                logger.warning(
+                    "Emoji ':%s:' exists in namespaces '%s' and '%s'; "
+                    "use ':%s:' to reference the '%s' one",
+                    emoji_name,
+                    owner,
+                    namespace,
+                    full_name,
+                    namespace,
+                )
+                continue
+
+            emoji_paths[emoji_name] = rel_path
+            emoji_map[f":{emoji_name}:"] = _CustomEmojiEntry(emoji_name)
+
+    entries = _CustomEntries(signature=signature, emoji_paths=emoji_paths, emoji=emoji_map)
+    _entries_cache[cache_key] = entries
+    return entries
+
+
 def create_custom_emoji_index(
     icons_dir: Path,
     options: dict[str, Any],
@@ -48,58 +213,18 @@ def create_custom_emoji_index(
     # Start with standard Twemoji index
     index = twemoji(options, md)
 
+    entries = _get_custom_entries(icons_dir, namespace_prefix_required)
+
     # Create fresh config for this build and store on md instance
     config = EmojiIndexConfig(
         namespace_prefix_required=namespace_prefix_required,
+        emoji_paths=dict(entries.emoji_paths),
     )
     setattr(md, _MD_CONFIG_ATTR, config)
 
-    if icons_dir.exists():
-        for namespace_dir in icons_dir.iterdir():
-            if not namespace_dir.is_dir():
-                continue
-
-            namespace = namespace_dir.name
-
-            # Scan for emoji files
-            for emoji_file in namespace_dir.iterdir():
-                if emoji_file.name.startswith("."):
-                    continue
-
-                # Get emoji name without extension
-                emoji_name = emoji_file.stem
-
-                # Store relative path for the generator to use
-                rel_path = f"assets/emojis/{namespace}/{emoji_file.name}"
-
-                # Add to the emoji index with both prefixed and unprefixed names
-                if "emoji" not in index:
-                    index["emoji"] = {}
-                if "alias" not in index:
-                    index["alias"] = {}
-
-                # Add with namespace prefix (e.g., :slack-partyparrot:)
-                full_name = f"{namespace}-{emoji_name}"
-                full_name_with_colons = f":{full_name}:"
-                config.emoji_paths[full_name] = rel_path
-                # Use a placeholder Unicode (U+E000 is in Private Use Area)
-                index["emoji"][full_name_with_colons] = {
-                    "name": full_name,
-                    "unicode": "e000",  # Private Use Area placeholder
-                    "category": "custom",
-                }
-                index["alias"][full_name_with_colons] = full_name_with_colons
-
-                # Also add without prefix (e.g., :partyparrot:) unless namespace prefix is required
-                if not namespace_prefix_required:
-                    emoji_name_with_colons = f":{emoji_name}:"
-                    config.emoji_paths[emoji_name] = rel_path
-                    index["emoji"][emoji_name_with_colons] = {
-                        "name": emoji_name,
-                        "unicode": "e000",  # Private Use Area placeholder
-                        "category": "custom",
-                    }
-                    index["alias"][emoji_name_with_colons] = emoji_name_with_colons
+    # Add to the emoji index with both prefixed and unprefixed names
+    index.setdefault("emoji", {}).update(entries.emoji)
+    index.setdefault("alias", {}).update(zip(entries.emoji, entries.emoji, strict=True))
 
     return index
 
@@ -0,0 +1,40 @@
+"""Shared HTTP session for provider API calls and emoji downloads."""
+
+from functools import cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from mkdocs_external_emojis.constants import MAX_DOWNLOAD_WORKERS, MAX_PROVIDER_WORKERS
+
+
+@cache
+def get_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session.
+
+    Reusing one session keeps connections (and their TLS handshakes) alive
+    across provider API calls and emoji downloads. Transient errors and rate
+    limits are retried with backoff.
+
+    Returns:
+        Shared requests session
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        # Return the last response so callers' raise_for_status() reports it
+        raise_on_status=False,
+    )
+    # Room for every download on the shared download pool plus one API call per
+    # concurrently synced provider, so no kept-alive connection is discarded
+    adapter = HTTPAdapter(
+        pool_maxsize=MAX_DOWNLOAD_WORKERS + MAX_PROVIDER_WORKERS, max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -1,8 +1,10 @@
 """Data models for emoji providers and configuration."""
 
+import sys
 from dataclasses import dataclass, field
 from enum import StrEnum
-from pathlib import Path, PurePath
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, cast
 from urllib.parse import urlparse
 
@@ -24,7 +26,22 @@ class EmojiFormat(StrEnum):
     WEBP = "webp"
 
 
-@dataclass
+_EXT_TO_FORMAT: dict[str, EmojiFormat] = {fmt.value: fmt for fmt in EmojiFormat}
+
+
+@lru_cache(maxsize=8192)
+def _detect_format_from_url(url: str) -> EmojiFormat | None:
+    """Detect emoji format from URL path extension."""
+    # Only the path counts: not the host (https://cdn.png), query or fragment.
+    # Cached, so the urlparse cost is paid once per URL
+    path = urlparse(url).path.rstrip("/")
+    stem, _, ext = path.rpartition("/")[2].rpartition(".")
+    if not stem:
+        return None
+    return _EXT_TO_FORMAT.get(ext.lower())
+
+
+@dataclass(slots=True, frozen=True)
 class EmojiInfo:
     """Information about a single emoji."""
 
@@ -39,16 +56,6 @@ class EmojiInfo:
         """Check if this emoji is an alias."""
         return self.alias_of is not None
 
-    @staticmethod
-    def _detect_format_from_url(url: str) -> EmojiFormat | None:
-        """Detect emoji format from URL path extension."""
-        path = urlparse(url).path
-        suffix = PurePath(path).suffix.lower().lstrip(".")
-        try:
-            return EmojiFormat(suffix)
-        except ValueError:
-            return None
-
     def get_file_extension(self) -> str:
         """
         Get file extension for this emoji.
@@ -60,7 +67,7 @@ class EmojiInfo:
             return self.format.value
 
         if self.url:
-            fmt = self._detect_format_from_url(self.url)
+            fmt = _detect_format_from_url(self.url)
             if fmt:
                 return fmt.value
 
@@ -69,15 +76,15 @@ class EmojiInfo:
     @classmethod
     def from_url(cls, name: str, url: str) -> "EmojiInfo":
         """Create EmojiInfo from name and URL."""
-        return cls(name=name, url=url, format=cls._detect_format_from_url(url))
+        return cls(name=sys.intern(name), url=url, format=_detect_format_from_url(url))
 
     @classmethod
     def from_alias(cls, name: str, target: str) -> "EmojiInfo":
         """Create EmojiInfo for an alias."""
-        return cls(name=name, url=None, alias_of=target)
+        return cls(name=sys.intern(name), url=None, alias_of=sys.intern(target))
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderFilter:
     """Filtering configuration for emoji providers."""
 
@@ -85,7 +92,7 @@ class ProviderFilter:
     exclude_patterns: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderConfig:
     """Configuration for a single emoji provider."""
 
@@ -101,11 +108,13 @@ class ProviderConfig:
         if isinstance(self.type, str):
             self.type = ProviderType(self.type)
 
+        self.namespace = sys.intern(self.namespace)
+
         if isinstance(self.filters, dict):
             self.filters = ProviderFilter(**cast("dict[str, Any]", self.filters))
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheConfig:
     """Cache configuration."""
 
@@ -119,7 +128,7 @@ class CacheConfig:
             self.directory = Path(self.directory)
 
 
-@dataclass
+@dataclass(slots=True)
 class EmojiOptions:
     """Global emoji configuration options."""
 
@@ -138,16 +147,18 @@ class EmojiOptions:
         Returns:
             Formatted emoji name (always namespace-name format)
         """
-        return f"{namespace}-{name}"
+        return sys.intern(f"{namespace}-{name}")
 
 
-@dataclass
+@dataclass(slots=True)
 class EmojiConfig:
     """Complete emoji configuration."""
 
     providers: list[ProviderConfig]
     cache: CacheConfig = field(default_factory=CacheConfig)
     emojis: EmojiOptions = field(default_factory=EmojiOptions)
+    providers_by_namespace: dict[str, ProviderConfig] = field(init=False, repr=False, compare=False)
+    enabled_providers: tuple[ProviderConfig, ...] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate and normalize configuration."""
@@ -164,19 +175,26 @@ class EmojiConfig:
             for p in self.providers
         ]
 
+        # Index providers by namespace for O(1) lookups (first entry wins on duplicates)
+        self.providers_by_namespace = {}
+        for provider in self.providers:
+            self.providers_by_namespace.setdefault(provider.namespace, provider)
+
+        # Providers are not expected to change after loading; re-run
+        # __post_init__ if they are edited in place
+        self.enabled_providers = tuple(p for p in self.providers if p.enabled)
+
     def get_enabled_providers(self) -> list[ProviderConfig]:
-        """Get list of enabled providers."""
-        return [p for p in self.providers if p.enabled]
+        """Get enabled providers."""
+        # A new list each call, so callers can modify it without touching the config
+        return list(self.enabled_providers)
 
     def get_provider_by_namespace(self, namespace: str) -> ProviderConfig | None:
         """Get provider by namespace."""
-        for provider in self.providers:
-            if provider.namespace == namespace:
-                return provider
-        return None
+        return self.providers_by_namespace.get(namespace)
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncResult:
     """Result of an emoji sync operation."""
 
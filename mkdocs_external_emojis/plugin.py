@@ -2,7 +2,10 @@
 
 import contextlib
 import logging
+import os
 import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -12,20 +15,46 @@ from mkdocs.structure.files import File, Files
 from mkdocs.structure.pages import _AbsoluteLinksValidationValue
 
 from mkdocs_external_emojis.config import ConfigError, load_config, validate_environment
-from mkdocs_external_emojis.constants import DEFAULT_CONFIG_FILE, LOGGER_NAME
+from mkdocs_external_emojis.constants import DEFAULT_CONFIG_FILE, LOGGER_NAME, MAX_PROVIDER_WORKERS
 from mkdocs_external_emojis.emoji_index import (
     create_custom_emoji_index,
     custom_emoji_generator,
 )
-from mkdocs_external_emojis.providers import ProviderError, create_provider
+from mkdocs_external_emojis.providers import AbstractEmojiProvider, ProviderError, create_provider
 from mkdocs_external_emojis.sync import SyncManager
 
 if TYPE_CHECKING:
-    from mkdocs_external_emojis.models import EmojiConfig
+    from mkdocs_external_emojis.models import EmojiConfig, SyncResult
 
 logger = logging.getLogger(LOGGER_NAME)
 
 
+def _walk_files(root: str) -> Iterator[str]:
+    """
+    Yield paths of all non-hidden files under a directory, relative to it.
+
+    Hidden files and directories are skipped, and hidden directories are not
+    descended into.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        File paths relative to root
+    """
+    prefix_len = len(root.rstrip(os.sep)) + 1
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path[prefix_len:]
+
+
 class ExternalEmojisPluginConfig(base.Config):
     """Plugin configuration schema."""
 
@@ -118,47 +147,62 @@ class ExternalEmojisPlugin(BasePlugin[ExternalEmojisPluginConfig]):
 
         logger.info("Syncing emojis from external providers...")
 
-        # Sync each enabled provider
+        # Create provider instances
+        providers: list[AbstractEmojiProvider] = []
         for provider_config in self.emoji_config.get_enabled_providers():
-            logger.info(
-                f"Syncing {provider_config.type.value} "
-                f"provider (namespace: {provider_config.namespace})..."
-            )
-
-            # Create provider instance
             try:
-                provider = create_provider(provider_config)
+                providers.append(create_provider(provider_config))
             except ProviderError as e:
                 error_msg = f"Failed to initialize provider {provider_config.namespace}: {e}"
                 if self.config.fail_on_error:
                     raise ProviderError(error_msg) from e
                 logger.warning(error_msg)
-                continue
-
-            # Sync emojis
-            try:
-                result = self.sync_manager.sync_provider(provider)
-
-                logger.info(
-                    f"Synced {result.synced} emojis, {result.cached} cached, "
-                    f"{result.skipped} skipped for {provider_config.namespace}"
-                )
 
-                if result.errors:
-                    logger.warning(
-                        f"Encountered {len(result.errors)} errors while syncing "
-                        f"{provider_config.namespace}"
-                    )
-                    for error in result.errors[:5]:  # Show first 5 errors
-                        logger.warning(f"  - {error}")
-                    if len(result.errors) > 5:
-                        logger.warning(f"  ... and {len(result.errors) - 5} more")
+        # Sync providers concurrently; the work is network and disk bound
+        sync_manager = self.sync_manager
 
+        def sync_one(provider: AbstractEmojiProvider) -> "SyncResult | Exception":
+            logger.info(
+                f"Syncing {provider.config.type.value} "
+                f"provider (namespace: {provider.config.namespace})..."
+            )
+            try:
+                return sync_manager.sync_provider(provider)
             except Exception as e:
-                error_msg = f"Failed to sync {provider_config.namespace}: {e}"
+                return e
+
+        if len(providers) <= 1:
+            outcomes = [sync_one(provider) for provider in providers]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(len(providers), MAX_PROVIDER_WORKERS)
+            ) as executor:
+                outcomes = list(executor.map(sync_one, providers))
+
+        # Report results in config order
+        for provider, outcome in zip(providers, outcomes, strict=True):
+            namespace = provider.config.namespace
+
+            if isinstance(outcome, Exception):
+                error_msg = f"Failed to sync {namespace}: {outcome}"
                 if self.config.fail_on_error:
-                    raise ProviderError(error_msg) from e
+                    raise ProviderError(error_msg) from outcome
                 logger.warning(error_msg)
+                continue
+
+            logger.info(
+                f"Synced {outcome.synced} emojis, {outcome.cached} cached, "
+                f"{outcome.skipped} skipped for {namespace}"
+            )
+
+            if outcome.errors:
+                logger.warning(
+                    f"Encountered {len(outcome.errors)} errors while syncing {namespace}"
+                )
+                for error in outcome.errors[:5]:  # Show first 5 errors
+                    logger.warning(f"  - {error}")
+                if len(outcome.errors) > 5:
+                    logger.warning(f"  ... and {len(outcome.errors) - 5} more")
 
         logger.info("Emoji sync complete")
 
@@ -174,18 +218,19 @@ class ExternalEmojisPlugin(BasePlugin[ExternalEmojisPluginConfig]):
         site_dir = config["site_dir"]
         use_directory_urls = config.get("use_directory_urls", True)
 
-        for emoji_file in icons_dir.rglob("*"):
-            if emoji_file.is_file() and not emoji_file.name.startswith("."):
-                rel_path = str(emoji_file.relative_to(icons_dir))
-                src_path = f"assets/emojis/{rel_path}"
-                files.append(
-                    File(
-                        src_path,
-                        src_dir=str(icons_dir.parent.parent),
-                        dest_dir=site_dir,
-                        use_directory_urls=use_directory_urls,
-                    )
+        src_dir = str(icons_dir.parent.parent)
+
+        # MkDocs creates a new plugin instance for every serve rebuild and sets
+        # each File's inclusion in place, so File objects are built fresh each time
+        for rel_path in _walk_files(str(icons_dir)):
+            files.append(
+                File(
+                    f"assets/emojis/{rel_path}",
+                    src_dir=src_dir,
+                    dest_dir=site_dir,
+                    use_directory_urls=use_directory_urls,
                 )
+            )
 
         return files
 
@@ -221,24 +266,14 @@ class ExternalEmojisPlugin(BasePlugin[ExternalEmojisPluginConfig]):
             )
             return
 
-        # Check if pymdownx.emoji is in markdown_extensions
-        md_extensions = config["markdown_extensions"]
-        emoji_extension_found = False
-
-        for ext in md_extensions:
-            # Check both string and dict formats
-            ext_name = (
-                ext
-                if isinstance(ext, str)
-                else next(iter(ext.keys()))
-                if isinstance(ext, dict)
-                else None
-            )
-            if ext_name == "pymdownx.emoji":
-                emoji_extension_found = True
-                break
+        # Check if pymdownx.emoji is in markdown_extensions (string or dict entries)
+        ext_names = {
+            ext if isinstance(ext, str) else next(iter(ext), None)
+            for ext in config["markdown_extensions"]
+            if isinstance(ext, str | dict)
+        }
 
-        if not emoji_extension_found:
+        if "pymdownx.emoji" not in ext_names:
             logger.warning(
                 "pymdownx.emoji extension not found in markdown_extensions - "
                 "emojis will not be available. Please add it to your mkdocs.yml"
@@ -1,10 +1,19 @@
 """Abstract base class for emoji providers."""
 
 import fnmatch
+import os
+import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
+from mkdocs_external_emojis.http import get_session
 from mkdocs_external_emojis.models import EmojiInfo, ProviderConfig
 
+if TYPE_CHECKING:
+    from mkdocs_external_emojis.sync.response_cache import ResponseCache
+
 
 class ProviderError(Exception):
     """Provider-specific error."""
@@ -12,9 +21,33 @@ class ProviderError(Exception):
     pass
 
 
+@lru_cache(maxsize=64)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """
+    Compile glob patterns into a single regex matching any of them.
+
+    Matching follows fnmatch.fnmatch, so it is case-insensitive on platforms
+    with case-insensitive paths (Windows).
+
+    Args:
+        patterns: fnmatch-style glob patterns
+
+    Returns:
+        Compiled alternation of the translated patterns, or None if there are none
+    """
+    if not patterns:
+        return None
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile("|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns), flags)
+
+
 class AbstractEmojiProvider(ABC):
     """Abstract base class for emoji providers."""
 
+    # Whether downloaded images come from a source trusted to serve valid images,
+    # so they only need a signature check rather than a full parse
+    TRUSTED_IMAGES = False
+
     def __init__(self, config: ProviderConfig) -> None:
         """
         Initialize the provider.
@@ -23,6 +56,42 @@ class AbstractEmojiProvider(ABC):
             config: Provider configuration
         """
         self.config = config
+        self.session = get_session()
+
+        # Set by the sync manager to reuse emoji list responses between runs
+        self.response_cache: ResponseCache | None = None
+
+    def _get_json(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float,
+        cacheable: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """
+        Fetch a JSON API response, through the response cache if one is set.
+
+        Args:
+            url: URL to fetch
+            headers: Request headers
+            timeout: Request timeout in seconds
+            cacheable: Optional check that a parsed body is worth caching
+
+        Returns:
+            Parsed JSON body
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails, or its
+                body is not valid JSON when no response cache is set
+            ProviderError: If the body is not valid JSON when read through the
+                response cache
+        """
+        if self.response_cache is not None:
+            return self.response_cache.get_json(self.session, url, headers, timeout, cacheable)
+
+        response = self.session.get(url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
 
     @abstractmethod
     def fetch_emojis(self) -> dict[str, EmojiInfo]:
@@ -70,27 +139,24 @@ class AbstractEmojiProvider(ABC):
         Returns:
             Filtered dictionary of emojis
         """
-        if not self.config.filters.include_patterns and not self.config.filters.exclude_patterns:
-            return emojis
-
-        filtered: dict[str, EmojiInfo] = {}
-
-        for name, emoji in emojis.items():
-            # Check exclude patterns first
-            if self.config.filters.exclude_patterns and any(
-                fnmatch.fnmatch(name, pattern) for pattern in self.config.filters.exclude_patterns
-            ):
-                continue
+        include_re = _compile_patterns(tuple(self.config.filters.include_patterns))
+        exclude_re = _compile_patterns(tuple(self.config.filters.exclude_patterns))
 
-            # Check include patterns
-            if self.config.filters.include_patterns and not any(
-                fnmatch.fnmatch(name, pattern) for pattern in self.config.filters.include_patterns
-            ):
-                continue
+        # Pick the comprehension once so the per-emoji check has no extra branches
+        if exclude_re is None:
+            if include_re is None:
+                return emojis
+            return {name: emoji for name, emoji in emojis.items() if include_re.match(name)}
 
-            filtered[name] = emoji
+        if include_re is None:
+            return {name: emoji for name, emoji in emojis.items() if not exclude_re.match(name)}
 
-        return filtered
+        # Exclude patterns take precedence over include patterns
+        return {
+            name: emoji
+            for name, emoji in emojis.items()
+            if not exclude_re.match(name) and include_re.match(name)
+        }
 
     def resolve_aliases(self, emojis: dict[str, EmojiInfo]) -> dict[str, EmojiInfo]:
         """
@@ -102,36 +168,42 @@ class AbstractEmojiProvider(ABC):
         Returns:
             Dictionary with aliases resolved (pointing to same URL as target)
         """
-        resolved: dict[str, EmojiInfo] = {}
+        resolved: dict[str, EmojiInfo] = {
+            name: emoji for name, emoji in emojis.items() if not emoji.is_alias
+        }
+
+        # Terminal (non-alias) emoji each name resolves to; None if unresolvable
+        targets: dict[str, EmojiInfo | None] = dict(resolved)
 
-        # First pass: add non-aliases
         for name, emoji in emojis.items():
             if not emoji.is_alias:
-                resolved[name] = emoji
+                continue
 
-        # Second pass: resolve aliases
-        max_depth = 10  # Prevent infinite loops
-        for name, emoji in emojis.items():
-            if emoji.is_alias and emoji.alias_of:
-                target = emoji.alias_of
-                depth = 0
-
-                # Follow the alias chain
-                while target in emojis and emojis[target].is_alias and depth < max_depth:
-                    next_target = emojis[target].alias_of
-                    if next_target is None:
-                        break
-                    target = next_target
-                    depth += 1
-
-                # Get the final target emoji
-                if target in resolved:
-                    target_emoji = resolved[target]
-                    # Create a copy with the alias name
-                    resolved[name] = EmojiInfo(
-                        name=name,
-                        url=target_emoji.url,
-                        format=target_emoji.format,
-                    )
+            # Follow the alias chain until we reach a name we already know about
+            chain: list[str] = []
+            seen: set[str] = set()
+            current = name
+            while current not in targets:
+                current_emoji = emojis.get(current)
+                if current_emoji is None or current_emoji.alias_of is None or current in seen:
+                    # Missing target or a cycle
+                    targets[current] = None
+                    break
+                chain.append(current)
+                seen.add(current)
+                current = current_emoji.alias_of
+
+            # Path compression: every alias on the chain shares the same terminal
+            target_emoji = targets[current]
+            for alias_name in chain:
+                targets[alias_name] = target_emoji
+
+            if target_emoji is not None:
+                # Create a copy with the alias name
+                resolved[name] = EmojiInfo(
+                    name=name,
+                    url=target_emoji.url,
+                    format=target_emoji.format,
+                )
 
         return resolved
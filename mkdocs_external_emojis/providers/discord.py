@@ -13,6 +13,7 @@ class DiscordEmojiProvider(AbstractEmojiProvider):
 
     API_BASE = "https://discord.com/api/v10"
     CDN_BASE = "https://cdn.discordapp.com/emojis"
+    TRUSTED_IMAGES = True
 
     def __init__(self, config: ProviderConfig) -> None:
         """
@@ -57,34 +58,30 @@ class DiscordEmojiProvider(AbstractEmojiProvider):
         url = f"{self.API_BASE}/guilds/{self.guild_id}/emojis"
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
+            data = self._get_json(
+                url, headers, timeout=30, cacheable=lambda body: isinstance(body, list)
+            )
         except requests.exceptions.RequestException as e:
             raise ProviderError(f"Failed to fetch emojis from Discord: {e}") from e
 
-        data = response.json()
-
         if isinstance(data, dict) and "message" in data:
             raise ProviderError(f"Discord API error: {data['message']}")
 
-        emojis: dict[str, EmojiInfo] = {}
-
-        for emoji_data in data:
-            name = emoji_data.get("name")
-            emoji_id = emoji_data.get("id")
-            animated = emoji_data.get("animated", False)
-
-            if not name or not emoji_id:
-                continue
-
-            extension = "gif" if animated else "png"
-            url = f"{self.CDN_BASE}/{emoji_id}.{extension}"
-
-            emojis[name] = EmojiInfo.from_url(name, url)
+        # Entries missing a name or id can't be referenced and are skipped
+        emojis = {
+            emoji_data["name"]: EmojiInfo.from_url(
+                emoji_data["name"],
+                self._emoji_url(emoji_data["id"], emoji_data.get("animated", False)),
+            )
+            for emoji_data in data
+            if emoji_data.get("name") and emoji_data.get("id")
+        }
 
-        emojis = self.filter_emojis(emojis)
+        return self.filter_emojis(emojis)
 
-        return emojis
+    def _emoji_url(self, emoji_id: str, animated: bool) -> str:
+        """Build the CDN URL of an emoji; animated emojis are served as GIF."""
+        return f"{self.CDN_BASE}/{emoji_id}.{'gif' if animated else 'png'}"
 
     def validate_config(self) -> int:
         """
@@ -109,7 +106,7 @@ class DiscordEmojiProvider(AbstractEmojiProvider):
         url = f"{self.API_BASE}/guilds/{self.guild_id}/emojis"
 
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=10)
 
             if response.status_code == 401:
                 raise ProviderError("Invalid Discord token")
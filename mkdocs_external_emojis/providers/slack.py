@@ -44,13 +44,12 @@ class SlackEmojiProvider(AbstractEmojiProvider):
         }
 
         try:
-            response = requests.get(self.API_URL, headers=headers, timeout=30)
-            response.raise_for_status()
+            data = self._get_json(
+                self.API_URL, headers, timeout=30, cacheable=lambda body: bool(body.get("ok"))
+            )
         except requests.exceptions.RequestException as e:
             raise ProviderError(f"Failed to fetch emojis from Slack: {e}") from e
 
-        data = response.json()
-
         if not data.get("ok"):
             error = data.get("error", "Unknown error")
             raise ProviderError(f"Slack API error: {error}")
@@ -96,7 +95,7 @@ class SlackEmojiProvider(AbstractEmojiProvider):
 
         # Test the token by making a simple API call
         try:
-            response = requests.get(
+            response = self.session.get(
                 "https://slack.com/api/auth.test",
                 headers=headers,
                 timeout=10,
@@ -112,7 +111,7 @@ class SlackEmojiProvider(AbstractEmojiProvider):
 
         # Verify emoji:read permission by fetching emoji list
         try:
-            response = requests.get(self.API_URL, headers=headers, timeout=30)
+            response = self.session.get(self.API_URL, headers=headers, timeout=30)
             response.raise_for_status()
             data = response.json()
 
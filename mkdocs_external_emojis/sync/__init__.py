@@ -3,10 +3,12 @@
 from mkdocs_external_emojis.sync.cache import EmojiCache
 from mkdocs_external_emojis.sync.downloader import DownloadError, EmojiDownloader
 from mkdocs_external_emojis.sync.manager import SyncManager
+from mkdocs_external_emojis.sync.response_cache import ResponseCache
 
 __all__ = [
     "DownloadError",
     "EmojiCache",
     "EmojiDownloader",
+    "ResponseCache",
     "SyncManager",
 ]
@@ -1,30 +1,89 @@
 """Cache management for downloaded emojis."""
 
+import contextlib
 import json
 import logging
+import os
 import shutil
-from datetime import datetime, timedelta
+import tempfile
+import time
+from collections.abc import Mapping
+from dataclasses import replace
+from datetime import datetime
 from pathlib import Path
 from typing import Any, cast
 
+try:  # Prefer the Rust-backed JSON library when the "fast" extra is installed
+    import orjson
+except ImportError:
+    orjson = None
+
 from mkdocs_external_emojis.constants import LOGGER_NAME
-from mkdocs_external_emojis.models import CacheConfig, EmojiInfo
+from mkdocs_external_emojis.models import CacheConfig, EmojiFormat, EmojiInfo
 
 logger = logging.getLogger(LOGGER_NAME)
 
+# Metadata keys holding HTTP validators for conditional re-downloads
+_VALIDATOR_KEYS = ("etag", "last_modified")
+
+
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _cached_at_timestamp(value: Any) -> float | None:
+    """
+    Convert a metadata cached_at value to a unix timestamp.
+
+    Args:
+        value: Unix timestamp, or an ISO 8601 string written by older versions
+
+    Returns:
+        Unix timestamp, or None if the value is missing or unreadable
+    """
+    if isinstance(value, int | float):
+        return float(value)
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def _link_or_copy(source: Path, dest: Path) -> None:
+    """Hardlink source to dest, falling back to a copy (e.g. across devices)."""
+    dest.unlink(missing_ok=True)
+    try:
+        os.link(source, dest)
+    except OSError:
+        shutil.copy2(source, dest)
+
 
 class EmojiCache:
     """Manages caching of downloaded emoji files."""
 
     METADATA_FILE = ".metadata.json"
 
-    def __init__(self, config: CacheConfig, namespace: str) -> None:
+    def __init__(self, config: CacheConfig, namespace: str, load_metadata: bool = True) -> None:
         """
         Initialize emoji cache.
 
         Args:
             config: Cache configuration
             namespace: Provider namespace
+            load_metadata: Read existing metadata from disk; pass False when the
+                cache is only going to be cleaned
         """
         self.config = config
         self.namespace = namespace
@@ -32,7 +91,36 @@ class EmojiCache:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         self.metadata_file = self.cache_dir / self.METADATA_FILE
-        self.metadata = self._load_metadata()
+        self._ttl_seconds = config.ttl_hours * 3600
+        self.metadata = self._load_metadata() if load_metadata else {}
+
+        # Source URL -> name of the entry downloaded from it. Entries are checked
+        # against metadata on lookup, so this may go stale without harm.
+        self._names_by_url: dict[str, str] = {
+            meta["url"]: name for name, meta in self.metadata.items() if meta.get("url")
+        }
+
+        # File names written through this instance (new or replaced emojis)
+        self.stored_files: set[str] = set()
+
+        # While batching, metadata changes are only written on flush()
+        self._batching = False
+        self._dirty = False
+
+    def __enter__(self) -> "EmojiCache":
+        """Start batching metadata writes until the block exits."""
+        self._batching = True
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop batching and write any pending metadata changes."""
+        self._batching = False
+        self.flush()
+
+    def flush(self) -> None:
+        """Write metadata to disk if it changed since the last save."""
+        if self._dirty:
+            self._save_metadata()
 
     def _load_metadata(self) -> dict[str, Any]:
         """Load cache metadata from disk."""
@@ -40,8 +128,9 @@ class EmojiCache:
             return {}
 
         try:
-            with open(self.metadata_file) as f:
-                return cast("dict[str, Any]", json.load(f))
+            with open(self.metadata_file, "rb") as f:
+                return cast("dict[str, Any]", _loads_json(f.read()))
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
         except (OSError, json.JSONDecodeError) as e:
             logger.warning(
                 "Corrupt or unreadable cache metadata for %s, starting fresh: %s",
@@ -51,9 +140,21 @@ class EmojiCache:
             return {}
 
     def _save_metadata(self) -> None:
-        """Save cache metadata to disk."""
-        with open(self.metadata_file, "w") as f:
-            json.dump(self.metadata, f, indent=2)
+        """Save cache metadata to disk atomically."""
+        # Write a sibling file and rename it over the old one, so a crash mid-write
+        # can never leave a truncated metadata file (and a cold cache) behind
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=f"{self.METADATA_FILE}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dumps_json(self.metadata))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, self.metadata_file)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+        self._dirty = False
 
     def is_cached(self, emoji: EmojiInfo) -> bool:
         """
@@ -65,23 +166,21 @@ class EmojiCache:
         Returns:
             True if emoji is cached and not stale
         """
-        if emoji.name not in self.metadata:
+        meta = self.metadata.get(emoji.name)
+        if meta is None:
             return False
 
-        # Check if file exists
-        cached_path = self._get_cached_path(emoji)
-        if not cached_path.exists():
+        # The emoji now points at a different image
+        if emoji.url and meta.get("url") and meta["url"] != emoji.url:
             return False
 
-        # Check TTL
-        cached_time = self.metadata[emoji.name].get("cached_at")
-        if not cached_time:
+        # Check TTL before touching the filesystem
+        cached_at = _cached_at_timestamp(meta.get("cached_at"))
+        if cached_at is None or time.time() - cached_at >= self._ttl_seconds:
             return False
 
-        cached_dt = datetime.fromisoformat(cached_time)
-        ttl = timedelta(hours=self.config.ttl_hours)
-
-        return datetime.now() - cached_dt < ttl
+        # Check if file exists
+        return self._get_cached_path(emoji).exists()
 
     def get_cached_path(self, emoji: EmojiInfo) -> Path | None:
         """
@@ -99,38 +198,148 @@ class EmojiCache:
         path = self._get_cached_path(emoji)
         return path if path.exists() else None
 
+    def _get_entry_path(self, name: str, meta: dict[str, Any]) -> Path:
+        """Get expected path for a cached emoji from its metadata entry."""
+        try:
+            fmt = EmojiFormat(meta["format"]) if meta.get("format") else None
+        except ValueError:
+            fmt = None
+        return self._get_cached_path(EmojiInfo(name=name, url=meta.get("url"), format=fmt))
+
     def _get_cached_path(self, emoji: EmojiInfo) -> Path:
         """Get expected path for cached emoji file."""
         return self.cache_dir / f"{emoji.name}.{emoji.get_file_extension()}"
 
+    def get_file_path(self, emoji: EmojiInfo) -> Path:
+        """
+        Get the path an emoji's file is stored at, whether or not it is cached yet.
+
+        Downloads can be written straight to this path and then passed to store().
+
+        Args:
+            emoji: Emoji to locate
+
+        Returns:
+            Path of the emoji's file in the cache directory
+        """
+        return self._get_cached_path(emoji)
+
+    def get_validators(self, emoji: EmojiInfo) -> dict[str, str]:
+        """
+        Get HTTP validators for revalidating a cached (possibly stale) emoji.
+
+        Args:
+            emoji: Emoji to revalidate
+
+        Returns:
+            The "etag" and/or "last_modified" values recorded when the file was
+            downloaded, or an empty dict if the cached file cannot be reused
+        """
+        meta = self.metadata.get(emoji.name)
+        if not meta or meta.get("url") != emoji.url:
+            return {}
+        if not self._get_cached_path(emoji).exists():
+            return {}
+        return {key: meta[key] for key in _VALIDATOR_KEYS if meta.get(key)}
+
+    def touch(self, emoji: EmojiInfo) -> None:
+        """
+        Mark a cached emoji as fresh again without replacing its file.
+
+        Args:
+            emoji: Emoji the server confirmed as unchanged
+        """
+        self.metadata[emoji.name]["cached_at"] = time.time()
+        # Emojis sharing the URL are linked from this entry next
+        if emoji.url:
+            self._names_by_url[emoji.url] = emoji.name
+        self._mark_dirty()
+
     def store(
         self,
         emoji: EmojiInfo,
         file_path: Path,
         size_bytes: int,
+        validators: Mapping[str, str] | None = None,
     ) -> None:
         """
         Store emoji file in cache.
 
         Args:
             emoji: Emoji information
-            file_path: Path to downloaded file
+            file_path: Path to downloaded file; if it is already the emoji's cache
+                path (see get_file_path) only the metadata is recorded
             size_bytes: Size of the file in bytes
+            validators: Optional "etag"/"last_modified" values from the download
         """
         cached_path = self._get_cached_path(emoji)
 
-        # Copy file to cache
-        shutil.copy2(file_path, cached_path)
+        # Copy file to cache unless it was downloaded in place
+        if file_path != cached_path:
+            shutil.copyfile(file_path, cached_path)
+
+        self._record(emoji, size_bytes, validators)
+
+    def store_from_cache(self, emoji: EmojiInfo) -> bool:
+        """
+        Store emoji by reusing a fresh cached file downloaded from the same URL.
+
+        Aliases and renamed emojis share their image URL with an entry that is
+        already cached, so they can be hardlinked instead of downloaded again.
+
+        Args:
+            emoji: Emoji information
+
+        Returns:
+            True if a matching cached file was found and stored for this emoji
+        """
+        if not emoji.url:
+            return False
+
+        other_name = self._names_by_url.get(emoji.url)
+        if other_name is None or other_name == emoji.name:
+            return False
+
+        source = self.get_cached_path(replace(emoji, name=other_name))
+        if source is None:
+            return False
+
+        other_meta = self.metadata[other_name]
+        _link_or_copy(source, self._get_cached_path(emoji))
+        self._record(
+            emoji,
+            other_meta.get("size_bytes", source.stat().st_size),
+            {key: other_meta[key] for key in _VALIDATOR_KEYS if other_meta.get(key)},
+        )
+        return True
 
-        # Update metadata
-        self.metadata[emoji.name] = {
+    def _record(
+        self,
+        emoji: EmojiInfo,
+        size_bytes: int,
+        validators: Mapping[str, str] | None = None,
+    ) -> None:
+        """Record metadata for a newly stored emoji."""
+        self.stored_files.add(self._get_cached_path(emoji).name)
+        meta: dict[str, Any] = {
             "url": emoji.url,
             "format": emoji.format.value if emoji.format else None,
             "size_bytes": size_bytes,
-            "cached_at": datetime.now().isoformat(),
+            "cached_at": time.time(),
         }
+        if validators:
+            meta.update(validators)
+        self.metadata[emoji.name] = meta
+        if emoji.url:
+            self._names_by_url[emoji.url] = emoji.name
+
+        self._mark_dirty()
 
-        self._save_metadata()
+    def _mark_dirty(self) -> None:
+        """Save metadata now, or on flush() while batching."""
+        self._dirty = True
+        if not self._batching:
+            self.flush()
 
     def clean(self) -> int:
         """
@@ -141,10 +350,11 @@ class EmojiCache:
         """
         count = 0
         if self.cache_dir.exists():
-            for file in self.cache_dir.iterdir():
-                if file.name != self.METADATA_FILE:
-                    file.unlink()
-                    count += 1
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name != self.METADATA_FILE:
+                        os.unlink(entry.path)
+                        count += 1
 
             # Clear metadata
             self.metadata = {}
@@ -160,33 +370,23 @@ class EmojiCache:
             Number of files removed
         """
         count = 0
-        ttl = timedelta(hours=self.config.ttl_hours)
-        now = datetime.now()
+        cutoff = time.time() - self._ttl_seconds
 
         stale_names = []
         for name, meta in self.metadata.items():
-            cached_time = meta.get("cached_at")
-            if not cached_time:
-                stale_names.append(name)
-                continue
-
-            cached_dt = datetime.fromisoformat(cached_time)
-            if now - cached_dt >= ttl:
+            cached_at = _cached_at_timestamp(meta.get("cached_at"))
+            if cached_at is None or cached_at <= cutoff:
                 stale_names.append(name)
 
         # Remove stale files
         for name in stale_names:
-            # Find and remove the file
-            for file in self.cache_dir.iterdir():
-                if file.stem == name and file.name != self.METADATA_FILE:
-                    file.unlink()
-                    count += 1
-                    break
+            try:
+                self._get_entry_path(name, self.metadata.pop(name)).unlink()
+                count += 1
+            except FileNotFoundError:
+                pass
 
-            # Remove from metadata
-            del self.metadata[name]
-
-        if count > 0:
+        if stale_names:
             self._save_metadata()
 
         return count
@@ -198,10 +398,14 @@ class EmojiCache:
         Returns:
             Dictionary with cache stats
         """
-        total_files = len(list(self.cache_dir.glob("*"))) - 1  # Exclude metadata
-        total_size = sum(
-            f.stat().st_size for f in self.cache_dir.iterdir() if f.name != self.METADATA_FILE
-        )
+        total_files = 0
+        total_size = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                # Skip the metadata file and any temp file left next to it
+                if not entry.name.startswith(".") and entry.is_file():
+                    total_files += 1
+                    total_size += entry.stat().st_size
 
         return {
             "namespace": self.namespace,
@@ -4,16 +4,48 @@ import contextlib
 import logging
 import tempfile
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache
 from pathlib import Path
 
 import requests
-from PIL import Image
+from PIL import ImageFile
 
-from mkdocs_external_emojis.constants import LOGGER_NAME
+from mkdocs_external_emojis.constants import LOGGER_NAME, MAX_DOWNLOAD_WORKERS
+from mkdocs_external_emojis.http import get_session
 from mkdocs_external_emojis.models import EmojiInfo
 
 logger = logging.getLogger(LOGGER_NAME)
 
+# Leading bytes of the image formats Pillow would accept (PNG, GIF, JPEG); WebP
+# is a RIFF container and is checked separately in _has_image_signature
+_IMAGE_SIGNATURES = (b"\x89PNG\r\n\x1a\n", b"GIF87a", b"GIF89a", b"\xff\xd8\xff")
+# Enough bytes for the WebP check: "RIFF", a 4-byte size, then "WEBP"
+_SIGNATURE_LENGTH = 12
+
+
+def _has_image_signature(head: bytes) -> bool:
+    """Check whether the first bytes of a file look like a supported image."""
+    if head.startswith(_IMAGE_SIGNATURES):
+        return True
+    # Other RIFF containers (WAV, AVI, ...) share the prefix but not the form type
+    return head[:4] == b"RIFF" and head[8:12] == b"WEBP"
+
+
+@cache
+def _get_download_executor() -> ThreadPoolExecutor:
+    """
+    Get the process-wide thread pool for emoji downloads.
+
+    Providers are synced concurrently, so they share this pool rather than each
+    starting their own. Total downloads stay within MAX_DOWNLOAD_WORKERS, and
+    therefore within the shared session's connection pool.
+
+    Returns:
+        Shared download executor
+    """
+    return ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS, thread_name_prefix="emoji-download")
+
 
 class DownloadError(Exception):
     """Error during emoji download."""
@@ -24,16 +56,24 @@ class DownloadError(Exception):
 class EmojiDownloader:
     """Downloads and validates emoji images."""
 
-    def __init__(self, max_size_kb: int = 500, timeout: int = 30) -> None:
+    def __init__(
+        self,
+        max_size_kb: int = 500,
+        timeout: int = 30,
+        max_workers: int = MAX_DOWNLOAD_WORKERS,
+    ) -> None:
         """
         Initialize downloader.
 
         Args:
             max_size_kb: Maximum file size in KB
             timeout: Request timeout in seconds
+            max_workers: Maximum number of concurrent downloads
         """
         self.max_size_kb = max_size_kb
         self.timeout = timeout
+        self.max_workers = max_workers
+        self.session = get_session()
 
     def download(self, emoji: EmojiInfo) -> tuple[Path, int]:
         """
@@ -45,15 +85,59 @@ class EmojiDownloader:
         Returns:
             Tuple of (temp_file_path, size_in_bytes)
 
+        Raises:
+            DownloadError: If download fails
+        """
+        downloaded = self.download_if_modified(emoji)
+        if downloaded is None:
+            raise DownloadError(f"Unexpected 304 Not Modified for {emoji.name}")
+
+        temp_path, size, _ = downloaded
+        return temp_path, size
+
+    def download_if_modified(
+        self,
+        emoji: EmojiInfo,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        dest: Path | None = None,
+        magic_only: bool = False,
+    ) -> tuple[Path, int, dict[str, str]] | None:
+        """
+        Download emoji image from URL unless it is unchanged since a previous download.
+
+        Args:
+            emoji: Emoji to download
+            etag: ETag header from the previous download, if any
+            last_modified: Last-Modified header from the previous download, if any
+            dest: Optional final path for the image. It is streamed into a hidden
+                ".partial" file next to dest and renamed over dest once validated,
+                so a failed download never leaves a broken file at dest.
+            magic_only: Only check the file's leading bytes against known image
+                signatures instead of parsing it; for trusted image sources
+
+        Returns:
+            Tuple of (file_path, size_in_bytes, validators), or None if the
+            server reports the image as not modified. file_path is dest if given,
+            otherwise a temp file the caller must remove. validators holds the
+            response's "etag" and "last_modified" values for the next request.
+
         Raises:
             DownloadError: If download fails
         """
         if not emoji.url:
             raise DownloadError(f"No URL for emoji: {emoji.name}")
 
+        headers: dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
         try:
-            response = requests.get(
+            response = self.session.get(
                 emoji.url,
+                headers=headers,
                 timeout=self.timeout,
                 stream=True,
             )
@@ -61,6 +145,19 @@ class EmojiDownloader:
         except requests.exceptions.RequestException as e:
             raise DownloadError(f"Failed to download {emoji.name}: {e}") from e
 
+        if response.status_code == 304:
+            response.close()
+            return None
+
+        validators = {
+            key: value
+            for key, value in (
+                ("etag", response.headers.get("ETag")),
+                ("last_modified", response.headers.get("Last-Modified")),
+            )
+            if value
+        }
+
         # Check content length if available
         content_length = response.headers.get("content-length")
         if content_length:
@@ -72,9 +169,18 @@ class EmojiDownloader:
                     f"Emoji {emoji.name} too large: {size_kb:.1f}KB (max: {self.max_size_kb}KB)"
                 )
 
-        # Download to temporary file
-        with tempfile.NamedTemporaryFile(
-            delete=False, suffix=f".{emoji.format.value if emoji.format else 'png'}"
+        # Parse the image as it streams in so it never has to be read back from disk
+        parser = None if magic_only else ImageFile.Parser()
+        head = b""
+
+        # Download to a temporary file, or to a partial file next to dest that
+        # is hidden so directory scans never pick up a half-written image
+        with (
+            tempfile.NamedTemporaryFile(
+                delete=False, suffix=f".{emoji.format.value if emoji.format else 'png'}"
+            )
+            if dest is None
+            else dest.with_name(f".{dest.name}.partial").open("wb")
         ) as temp_file:
             try:
                 total_size = 0
@@ -87,6 +193,10 @@ class EmojiDownloader:
                             raise DownloadError(
                                 f"Emoji {emoji.name} exceeds size limit during download"
                             )
+                        if parser is not None:
+                            parser.feed(chunk)
+                        elif len(head) < _SIGNATURE_LENGTH:
+                            head += chunk[:_SIGNATURE_LENGTH]
                         temp_file.write(chunk)
 
                 temp_path = Path(temp_file.name)
@@ -97,53 +207,54 @@ class EmojiDownloader:
                     Path(temp_file.name).unlink()
                 raise DownloadError(f"Error downloading {emoji.name}: {e}") from e
 
-        # Validate it's actually an image (after file is closed)
-        self._validate_image(temp_path)
-
-        return temp_path, total_size
-
-    def _validate_image(self, file_path: Path) -> None:
-        """
-        Validate that the file is a valid image.
-
-        Args:
-            file_path: Path to image file
-
-        Raises:
-            DownloadError: If file is not a valid image
-        """
+        # Validate it's actually an image
         try:
-            with Image.open(file_path) as img:
-                img.verify()
+            if parser is not None:
+                parser.close()
+            elif not _has_image_signature(head):
+                raise ValueError("unrecognized image signature")
         except Exception as e:
+            temp_path.unlink(missing_ok=True)
             raise DownloadError(f"Invalid image file: {e}") from e
 
+        if dest is not None:
+            temp_path = temp_path.replace(dest)
+
+        return temp_path, total_size, validators
+
     def download_multiple(
         self,
         emojis: list[EmojiInfo],
         progress_callback: Callable[[str, int, int], None] | None = None,
     ) -> dict[str, tuple[Path, int]]:
         """
-        Download multiple emojis.
+        Download multiple emojis concurrently.
 
         Args:
             emojis: List of emojis to download
-            progress_callback: Optional callback(emoji_name, current, total)
+            progress_callback: Optional callback(emoji_name, current, total),
+                called from this thread as each download finishes
 
         Returns:
-            Dictionary mapping emoji names to (path, size) tuples
+            Dictionary mapping emoji names to (path, size) tuples, in input order
         """
-        results: dict[str, tuple[Path, int]] = {}
+        if not emojis:
+            return {}
+
+        downloaded: dict[str, tuple[Path, int]] = {}
         total = len(emojis)
 
-        for i, emoji in enumerate(emojis, 1):
-            if progress_callback:
-                progress_callback(emoji.name, i, total)
+        with ThreadPoolExecutor(max_workers=min(total, self.max_workers)) as executor:
+            futures = {executor.submit(self.download, emoji): emoji for emoji in emojis}
 
-            try:
-                results[emoji.name] = self.download(emoji)
-            except DownloadError as e:
-                logger.warning("Failed to download emoji %s: %s", emoji.name, e)
-                continue
+            for i, future in enumerate(as_completed(futures), 1):
+                emoji = futures[future]
+                if progress_callback:
+                    progress_callback(emoji.name, i, total)
+
+                try:
+                    downloaded[emoji.name] = future.result()
+                except DownloadError as e:
+                    logger.warning("Failed to download emoji %s: %s", emoji.name, e)
 
-        return results
+        return {emoji.name: downloaded[emoji.name] for emoji in emojis if emoji.name in downloaded}
@@ -1,19 +1,27 @@
 """Sync manager for coordinating emoji downloads and caching."""
 
 import logging
+import os
 import shutil
 from collections.abc import Callable
+from concurrent.futures import as_completed
 from pathlib import Path
 
-from mkdocs_external_emojis.constants import LOGGER_NAME
+from mkdocs_external_emojis.constants import LOGGER_NAME, PROVIDER_RESPONSE_MAX_AGE
 from mkdocs_external_emojis.models import (
     CacheConfig,
+    EmojiInfo,
     EmojiOptions,
     SyncResult,
 )
 from mkdocs_external_emojis.providers.base import AbstractEmojiProvider
-from mkdocs_external_emojis.sync.cache import EmojiCache
-from mkdocs_external_emojis.sync.downloader import DownloadError, EmojiDownloader
+from mkdocs_external_emojis.sync.cache import EmojiCache, _link_or_copy
+from mkdocs_external_emojis.sync.downloader import (
+    DownloadError,
+    EmojiDownloader,
+    _get_download_executor,
+)
+from mkdocs_external_emojis.sync.response_cache import ResponseCache
 
 logger = logging.getLogger(LOGGER_NAME)
 
@@ -63,6 +71,12 @@ class SyncManager:
         namespace = provider.config.namespace
         cache = EmojiCache(self.cache_config, namespace)
 
+        # Reuse the emoji list from a recent run (e.g. the previous serve rebuild)
+        provider.response_cache = ResponseCache(
+            self.cache_config.directory / f".provider_response.{namespace}.json",
+            max_age=0 if force else PROVIDER_RESPONSE_MAX_AGE,
+        )
+
         # Fetch emoji list from provider
         try:
             emojis = provider.fetch_emojis()
@@ -91,43 +105,128 @@ class SyncManager:
         if self.cache_config.clean_on_build or force:
             cache.clean()
 
-        # Download emojis
-        for i, (name, emoji) in enumerate(emojis.items(), 1):
-            if progress_callback:
-                progress_callback(name, i, len(emojis))
+        total = len(emojis)
+        done = 0
 
-            # Skip if cached and not forcing
-            if not force and cache.is_cached(emoji):
-                result.cached += 1
-                continue
+        def report(name: str) -> None:
+            nonlocal done
+            done += 1
+            if progress_callback:
+                progress_callback(name, done, total)
 
-            # Skip if no URL (shouldn't happen after alias resolution)
-            if not emoji.url:
-                result.skipped += 1
-                result.errors.append(f"No URL for emoji: {name}")
-                continue
+        # Download emojis, writing cache metadata once at the end
+        with cache:
+            # Emojis to download, grouped by URL so each image is fetched once
+            pending: dict[str, list[EmojiInfo]] = {}
 
-            # Download emoji
-            try:
-                temp_path, size = self.downloader.download(emoji)
+            for name, emoji in emojis.items():
+                # Skip if cached and not forcing
+                if not force and cache.is_cached(emoji):
+                    result.cached += 1
+                    report(name)
+                    continue
 
-                # Store in cache
-                cache.store(emoji, temp_path, size)
+                # Skip if no URL (shouldn't happen after alias resolution)
+                if not emoji.url:
+                    result.skipped += 1
+                    result.errors.append(f"No URL for emoji: {name}")
+                    report(name)
+                    continue
 
-                # Clean up temp file
-                temp_path.unlink()
+                # Reuse an image already cached under another name (e.g. an alias)
+                if emoji.url not in pending and cache.store_from_cache(emoji):
+                    result.cached += 1
+                    report(name)
+                    continue
 
-                result.synced += 1
+                pending.setdefault(emoji.url, []).append(emoji)
 
-            except DownloadError as e:
-                result.errors.append(str(e))
-                result.skipped += 1
+            if pending:
+                self._download_pending(
+                    cache, pending, result, report, magic_only=provider.TRUSTED_IMAGES
+                )
 
         # Sync cached emojis to icons directory
         self._sync_to_icons(cache, namespace)
 
         return result
 
+    def _download_pending(
+        self,
+        cache: EmojiCache,
+        pending: dict[str, list[EmojiInfo]],
+        result: SyncResult,
+        report: Callable[[str], None],
+        magic_only: bool = False,
+    ) -> None:
+        """
+        Download pending emojis concurrently and store them in the cache.
+
+        Downloads run on the process-wide download pool, which every provider
+        sync shares; the cache is only touched from this thread as each
+        download completes, so it needs no locking.
+
+        Args:
+            cache: Emoji cache for the namespace
+            pending: Emojis to download, grouped by URL; the first of each group
+                is downloaded and the others reuse its cached file
+            result: Sync result to update
+            report: Progress callback taking the emoji name
+            magic_only: Validate downloads by signature only (trusted providers)
+        """
+        executor = _get_download_executor()
+        futures = {
+            # Revalidate a stale cached copy if there is one, and stream a
+            # changed image straight into the cache
+            executor.submit(
+                self.downloader.download_if_modified,
+                group[0],
+                dest=cache.get_file_path(group[0]),
+                magic_only=magic_only,
+                **cache.get_validators(group[0]),
+            ): group
+            for group in pending.values()
+        }
+
+        try:
+            for future in as_completed(futures):
+                emoji, *others = futures[future]
+
+                try:
+                    downloaded = future.result()
+                except DownloadError as e:
+                    result.errors.append(str(e))
+                    result.skipped += 1 + len(others)
+                    for skipped in (emoji, *others):
+                        report(skipped.name)
+                    continue
+
+                if downloaded is None:
+                    # Unchanged on the server; keep the cached file
+                    cache.touch(emoji)
+                    result.cached += 1
+                else:
+                    file_path, size, validators = downloaded
+
+                    # Already in place; just record it
+                    cache.store(emoji, file_path, size, validators)
+
+                    result.synced += 1
+                report(emoji.name)
+
+                # Emojis sharing the image link to the file just stored
+                for other in others:
+                    if cache.store_from_cache(other):
+                        result.cached += 1
+                    else:
+                        result.skipped += 1
+                        result.errors.append(f"Could not reuse image for emoji: {other.name}")
+                    report(other.name)
+        finally:
+            # The pool outlives this call; drop queued downloads if storing one failed
+            for future in futures:
+                future.cancel()
+
     def _sync_to_icons(self, cache: EmojiCache, namespace: str) -> None:
         """
         Sync cached emojis to MkDocs icons directory.
@@ -140,13 +239,22 @@ class SyncManager:
         namespace_dir = self.icons_dir / namespace
         namespace_dir.mkdir(parents=True, exist_ok=True)
 
-        # Copy all cached emojis
-        for file in cache.cache_dir.iterdir():
-            if file.name == cache.METADATA_FILE:
-                continue
+        # Only publish emojis stored during this sync or missing from the icons
+        # directory; everything else is already in place
+        published = set(os.listdir(namespace_dir))
 
-            dest = namespace_dir / file.name
-            shutil.copy2(file, dest)
+        # Hardlink (or copy) the cached files
+        with os.scandir(cache.cache_dir) as entries:
+            for entry in entries:
+                # Skips the metadata file (and any temp file left next to it)
+                if entry.name.startswith("."):
+                    continue
+                if entry.name in published and entry.name not in cache.stored_files:
+                    continue
+                if not entry.is_file():
+                    continue
+
+                _link_or_copy(Path(entry.path), namespace_dir / entry.name)
 
     def clean_namespace(self, namespace: str) -> None:
         """
@@ -155,8 +263,8 @@ class SyncManager:
         Args:
             namespace: Provider namespace
         """
-        # Clean cache
-        cache = EmojiCache(self.cache_config, namespace)
+        # Clean cache; its metadata is about to be discarded, so don't read it
+        cache = EmojiCache(self.cache_config, namespace, load_metadata=False)
         cache.clean()
 
         # Clean icons directory
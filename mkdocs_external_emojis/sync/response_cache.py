@@ -0,0 +1,142 @@
+"""Persistent cache for provider API responses."""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import time
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from mkdocs_external_emojis.constants import LOGGER_NAME, PROVIDER_RESPONSE_MAX_AGE
+from mkdocs_external_emojis.providers.base import ProviderError
+from mkdocs_external_emojis.sync.cache import _dumps_json, _loads_json
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+def _headers_digest(headers: Mapping[str, str]) -> str:
+    """Digest the request headers, which carry the provider's credentials."""
+    return hashlib.sha256(repr(sorted(headers.items())).encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    Caches one provider's emoji list response between sync runs.
+
+    Responses younger than max_age are reused without a request. Older ones are
+    revalidated with If-None-Match when the server sent an ETag. A response is
+    only reused for the same URL and request headers, so a changed token (e.g.
+    another Slack workspace) always fetches a new list. Only a digest of the
+    headers is stored.
+    """
+
+    def __init__(self, path: Path, max_age: float = PROVIDER_RESPONSE_MAX_AGE) -> None:
+        """
+        Initialize response cache.
+
+        Args:
+            path: File the response is stored in
+            max_age: Seconds a stored response is reused without asking the server
+        """
+        self.path = path
+        self.max_age = max_age
+
+    def get_json(
+        self,
+        session: requests.Session,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float,
+        cacheable: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """
+        Get a JSON response, reusing the stored one when it is still valid.
+
+        Args:
+            session: HTTP session to send the request with
+            url: URL to fetch
+            headers: Request headers
+            timeout: Request timeout in seconds
+            cacheable: Optional check that a parsed body is a successful response
+                worth storing; error payloads should not be reused
+
+        Returns:
+            Parsed JSON body
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+            ProviderError: If the response body is not valid JSON
+        """
+        headers_hash = _headers_digest(headers)
+        entry = self._load(url, headers_hash)
+        request_headers = dict(headers)
+
+        if entry is not None:
+            if time.time() - entry["stored_at"] < self.max_age:
+                return entry["body"]
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+
+        response = session.get(url, headers=request_headers, timeout=timeout)
+        response.raise_for_status()
+
+        if response.status_code == 304 and entry is not None:
+            body = entry["body"]
+            etag = entry.get("etag")
+        else:
+            try:
+                body = _loads_json(response.content)
+            except ValueError as e:
+                # json and orjson decode errors (and bad UTF-8) all subclass ValueError
+                raise ProviderError(f"Invalid JSON response from {url}: {e}") from e
+            etag = response.headers.get("ETag")
+
+        if cacheable is None or cacheable(body):
+            self._save(url, headers_hash, etag, body)
+        return body
+
+    def _load(self, url: str, headers_hash: str) -> dict[str, Any] | None:
+        """Load the stored response for url and headers, or None if there is none."""
+        try:
+            entry = _loads_json(self.path.read_bytes())
+        except FileNotFoundError:
+            return None
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable provider response cache %s: %s", self.path, e)
+            return None
+
+        if (
+            not isinstance(entry, dict)
+            or entry.get("url") != url
+            or entry.get("headers_hash") != headers_hash
+            or "body" not in entry
+        ):
+            return None
+        entry.setdefault("stored_at", 0.0)
+        return entry
+
+    def _save(self, url: str, headers_hash: str, etag: str | None, body: Any) -> None:
+        """Store a response, replacing the previous one atomically."""
+        entry = {
+            "url": url,
+            "headers_hash": headers_hash,
+            "etag": etag,
+            "stored_at": time.time(),
+            "body": body,
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(_dumps_json(entry))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            # The cache is an optimization; a failed write only costs a refetch
+            logger.warning("Could not write provider response cache %s: %s", self.path, e)
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
@@ -1,17 +1,95 @@
 """Pytest configuration for integration tests."""
 
+import contextlib
+import hashlib
+import io
+import logging
 import os
+import shutil
+import subprocess
+from pathlib import Path
 
 import pytest
 
 REQUIRED_SECRETS = ["SLACK_TOKEN", "DISCORD_BOT_TOKEN", "DISCORD_GUILD_ID"]
 
+# Files and directories whose changes invalidate a previous site build
+BUILD_INPUTS = ["mkdocs.yml", "emoji-config.toml", "docs", "overrides", "mkdocs_external_emojis"]
+
+# Written into the site directory after a build, to reuse it on the next run
+BUILD_HASH_FILE = ".build-hash"
+BUILD_LOG_FILE = ".build-stderr"
+
 
 def secrets_available() -> bool:
     """Check if all required secrets are available."""
     return all(os.environ.get(var) for var in REQUIRED_SECRETS)
 
 
+def build_inputs_hash(project_root: Path) -> str:
+    """Hash the path, mtime and size of every file the site build reads.
+
+    The provider secrets are folded in too, so switching to another workspace or
+    guild rebuilds the site. Only their digest ends up in the written hash.
+    """
+    entries = [
+        f"{var}:{hashlib.sha256(os.environ.get(var, '').encode()).hexdigest()}"
+        for var in REQUIRED_SECRETS
+    ]
+    for name in BUILD_INPUTS:
+        path = project_root / name
+        files = sorted(path.rglob("*")) if path.is_dir() else [path]
+        for file in files:
+            if file.is_file() and "__pycache__" not in file.parts:
+                stat = file.stat()
+                entries.append(
+                    f"{file.relative_to(project_root)}:{stat.st_mtime_ns}:{stat.st_size}"
+                )
+    return hashlib.sha256("\n".join(entries).encode()).hexdigest()
+
+
+def build_in_process(project_root: Path) -> subprocess.CompletedProcess:
+    """Run the equivalent of `mkdocs build` in this interpreter.
+
+    Log output is captured as the result's stderr, like the CLI would print it.
+    """
+    from mkdocs.commands.build import build
+    from mkdocs.config import load_config
+
+    log = io.StringIO()
+    handler = logging.StreamHandler(log)
+    handler.setFormatter(logging.Formatter("%(levelname)-7s -  %(message)s"))
+    mkdocs_logger = logging.getLogger("mkdocs")
+    mkdocs_logger.addHandler(handler)
+
+    returncode = 0
+    try:
+        # The plugin resolves its config and icons directory from the working directory
+        with contextlib.chdir(project_root):
+            config = load_config(str(project_root / "mkdocs.yml"))
+            config.plugins.on_startup(command="build", dirty=False)
+            try:
+                build(config, dirty=False)
+            finally:
+                config.plugins.on_shutdown()
+    except Exception as e:
+        returncode = 1
+        log.write(f"ERROR   -  {e!r}\n")
+    finally:
+        mkdocs_logger.removeHandler(handler)
+
+    return subprocess.CompletedProcess(["mkdocs", "build"], returncode, "", log.getvalue())
+
+
+def pytest_addoption(parser):
+    """Register command line options."""
+    parser.addoption(
+        "--force-build",
+        action="store_true",
+        help="Rebuild the docs site even if its sources are unchanged",
+    )
+
+
 def pytest_configure(config):
     """Register custom markers."""
     config.addinivalue_line("markers", "integration: marks tests as integration tests")
@@ -28,7 +106,70 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_marker)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def project_root():
     """Return the project root directory."""
     return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def build_result(project_root, request):
+    """Build the mkdocs site once per test session and return the result.
+
+    The build runs in-process unless MKDOCS_TEST_SUBPROCESS=1 is set. A site
+    left by a previous run is reused when none of its sources changed, with the
+    stderr of the build that produced it.
+    """
+    root = Path(project_root)
+    site_dir = root / "site"
+    command = ["mkdocs", "build"]
+    inputs_hash = build_inputs_hash(root)
+
+    hash_file = site_dir / BUILD_HASH_FILE
+    log_file = site_dir / BUILD_LOG_FILE
+    if (
+        not request.config.getoption("--force-build")
+        and (site_dir / "index.html").exists()
+        and log_file.exists()
+        and hash_file.exists()
+        and hash_file.read_text() == inputs_hash
+    ):
+        return subprocess.CompletedProcess(command, 0, stdout="", stderr=log_file.read_text())
+
+    # Clean previous build
+    if site_dir.exists():
+        shutil.rmtree(site_dir)
+
+    # Run mkdocs build, in a fresh interpreter only if asked to (e.g. for CI parity)
+    if os.environ.get("MKDOCS_TEST_SUBPROCESS") == "1":
+        result = subprocess.run(
+            ["uv", "run", *command],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+        )
+    else:
+        result = build_in_process(root)
+
+    assert result.returncode == 0, f"mkdocs build failed:\n{result.stderr}"
+    assert site_dir.exists(), "Site directory was not created"
+
+    log_file.write_text(result.stderr)
+    hash_file.write_text(inputs_hash)
+
+    return result
+
+
+@pytest.fixture(scope="session")
+def built_site(build_result, project_root):
+    """Return the site directory path from a successful build."""
+    return Path(project_root) / "site"
+
+
+@pytest.fixture(scope="session")
+def test_page_source(built_site):
+    """Return the raw HTML bytes of the test page, leaving decoding to the parser."""
+    test_page = built_site / "test" / "index.html"
+    assert test_page.exists(), f"Test page not found at {test_page}"
+
+    return test_page.read_bytes()
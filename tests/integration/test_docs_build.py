@@ -1,13 +1,21 @@
 """Integration tests for mkdocs build with real API calls."""
 
-import subprocess
-from pathlib import Path
+import hashlib
+import importlib.util
+import re
 
 import pytest
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 pytestmark = pytest.mark.integration
 
+# The C-based lxml parser is much faster; fall back to the stdlib parser without it
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# pytest cache key for the extracted images; bump the version when their shape changes
+IMAGES_CACHE_KEY = "external-emojis/test-page-images"
+IMAGES_CACHE_VERSION = "2"
+
 # Expected emoji references in test.md
 # Format: (emoji_name, namespace_prefix)
 EXPECTED_EMOJIS = [
@@ -23,44 +31,49 @@ EXPECTED_EMOJIS = [
 
 
 @pytest.fixture(scope="module")
-def build_result(project_root):
-    """Build the mkdocs site and return the result."""
-    site_dir = Path(project_root) / "site"
-
-    # Clean previous build
-    if site_dir.exists():
-        import shutil
-
-        shutil.rmtree(site_dir)
-
-    # Run mkdocs build
-    result = subprocess.run(
-        ["uv", "run", "mkdocs", "build"],
-        cwd=project_root,
-        capture_output=True,
-        text=True,
-    )
-
-    assert result.returncode == 0, f"mkdocs build failed:\n{result.stderr}"
-    assert site_dir.exists(), "Site directory was not created"
-
-    return result
+def test_page_images(test_page_source, request):
+    """Return the test page's <img> tags as plain dicts, parsing nothing else.
+
+    Each dict holds the tag's "src", "class", "title" and "alt" attributes (when
+    present), so tests never touch the soup. The list is
+    kept in the pytest cache and reused while the page is unchanged.
+    """
+    page_hash = hashlib.sha256(f"{IMAGES_CACHE_VERSION}:".encode() + test_page_source).hexdigest()
+    cache = request.config.cache
+    cached = cache.get(IMAGES_CACHE_KEY, None) if cache is not None else None
+    if cached and cached.get("hash") == page_hash:
+        return cached["images"]
+
+    soup = BeautifulSoup(test_page_source, HTML_PARSER, parse_only=SoupStrainer("img"))
+    images = [
+        {key: img[key] for key in ("src", "class", "title", "alt") if img.has_attr(key)}
+        for img in soup.find_all("img")
+    ]
+
+    if cache is not None:
+        cache.set(IMAGES_CACHE_KEY, {"hash": page_hash, "images": images})
+    return images
 
 
 @pytest.fixture(scope="module")
-def built_site(build_result, project_root):
-    """Return the site directory path from a successful build."""
-    return Path(project_root) / "site"
-
-
-@pytest.fixture(scope="module")
-def test_page_html(built_site):
-    """Return the parsed HTML of the test page."""
-    test_page = built_site / "test" / "index.html"
-    assert test_page.exists(), f"Test page not found at {test_page}"
-
-    with open(test_page) as f:
-        return BeautifulSoup(f.read(), "html.parser")
+def emoji_images(test_page_images):
+    """Return the test page's <img> tags bucketed in one pass.
+
+    Keys are "all", "twemoji" (images with the twemoji class), and "slack" /
+    "discord" (images mentioning one of that provider's emoji names).
+    """
+    buckets = {"all": test_page_images, "twemoji": [], "slack": [], "discord": []}
+    for img in test_page_images:
+        if "twemoji" in img.get("class", []):
+            buckets["twemoji"].append(img)
+
+        # The emoji name shows up in the alt/title shortcode or the src path
+        text = f"{img.get('alt', '')} {img.get('title', '')} {img.get('src', '')}"
+        if "partyparrot" in text or "shipit" in text:
+            buckets["slack"].append(img)
+        if "meow_party" in text or "stonks" in text:
+            buckets["discord"].append(img)
+    return buckets
 
 
 class TestDocsBuild:
@@ -80,26 +93,19 @@ class TestDocsBuild:
 class TestEmojiRendering:
     """Tests for emoji rendering in the built documentation."""
 
-    def test_emoji_images_present(self, test_page_html):
+    def test_emoji_images_present(self, emoji_images):
         """Verify emoji images are rendered in the test page."""
-        img_tags = test_page_html.find_all("img")
-        emoji_images = [
-            img for img in img_tags if img.get("class") and "twemoji" in img.get("class", [])
-        ]
+        twemoji_images = emoji_images["twemoji"]
 
         # Should have 8 emoji images (4 emojis x 2 syntax variants each)
-        assert len(emoji_images) >= 8, (
-            f"Expected at least 8 emoji images, found {len(emoji_images)}"
+        assert len(twemoji_images) >= 8, (
+            f"Expected at least 8 emoji images, found {len(twemoji_images)}"
         )
 
-    def test_slack_emojis_have_valid_src(self, test_page_html):
+    def test_slack_emojis_have_valid_src(self, emoji_images):
         """Verify Slack emojis have valid image sources."""
-        img_tags = test_page_html.find_all("img")
-
-        # Find images with partyparrot or shipit in alt or src
-        slack_emojis = [
-            img for img in img_tags if any(name in str(img) for name in ["partyparrot", "shipit"])
-        ]
+        # Images with partyparrot or shipit in alt or src
+        slack_emojis = emoji_images["slack"]
 
         assert len(slack_emojis) >= 4, (
             f"Expected at least 4 Slack emoji images, found {len(slack_emojis)}"
@@ -113,14 +119,10 @@ class TestEmojiRendering:
                 f"Unexpected src format: {src}"
             )
 
-    def test_discord_emojis_have_valid_src(self, test_page_html):
+    def test_discord_emojis_have_valid_src(self, emoji_images):
         """Verify Discord emojis have valid image sources."""
-        img_tags = test_page_html.find_all("img")
-
-        # Find images with meow_party or stonks in alt or src
-        discord_emojis = [
-            img for img in img_tags if any(name in str(img) for name in ["meow_party", "stonks"])
-        ]
+        # Images with meow_party or stonks in alt or src
+        discord_emojis = emoji_images["discord"]
 
         assert len(discord_emojis) >= 4, (
             f"Expected at least 4 Discord emoji images, found {len(discord_emojis)}"
@@ -134,14 +136,9 @@ class TestEmojiRendering:
                 f"Unexpected src format: {src}"
             )
 
-    def test_emoji_alt_text(self, test_page_html):
+    def test_emoji_alt_text(self, emoji_images):
         """Verify emoji images have appropriate alt and title text for accessibility."""
-        img_tags = test_page_html.find_all("img")
-        emoji_images = [
-            img for img in img_tags if img.get("class") and "twemoji" in img.get("class", [])
-        ]
-
-        for img in emoji_images:
+        for img in emoji_images["twemoji"]:
             title = img.get("title", "")
             alt = img.get("alt", "")
             # Title should contain the emoji name in :name: format
@@ -166,7 +163,12 @@ class TestUnresolvedEmojiWarning:
         for name in ["partyparrot", "shipit", "meow_party", "stonks"]:
             assert f"unresolved emoji ':{name}:'" not in build_result.stderr
 
-    def test_unresolved_emoji_stays_as_text(self, test_page_html):
+    def test_unresolved_emoji_stays_as_text(self, test_page_source):
         """Verify unresolved emoji shortcodes remain as plain text in the output."""
-        text = test_page_html.get_text()
-        assert ":unresolved-emoji:" in text
+        # Only keep text nodes mentioning the shortcode; attributes are not text
+        text_nodes = BeautifulSoup(
+            test_page_source,
+            HTML_PARSER,
+            parse_only=SoupStrainer(string=re.compile(":unresolved-emoji:")),
+        )
+        assert ":unresolved-emoji:" in text_nodes.get_text()
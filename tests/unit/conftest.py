@@ -1,11 +1,32 @@
 """Pytest configuration and shared fixtures."""
 
+import io
+from collections.abc import Iterator
+
 import pytest
+from PIL import Image
+
 
+@pytest.fixture(scope="package", autouse=True)
+def clean_environment() -> Iterator[None]:
+    """Clean environment variables once for the unit test package.
 
-@pytest.fixture(autouse=True)
-def clean_environment(monkeypatch):
-    """Clean environment variables for each test."""
+    Tests that set variables do so through monkeypatch or patch.dict, which
+    restore the environment afterwards, so one cleanup up front is enough. The
+    variables are restored when the package finishes, so tests collected after
+    it in the same session (e.g. the integration build) still see them.
+    """
+    monkeypatch = pytest.MonkeyPatch()
     # Remove common token env vars
     for var in ["SLACK_TOKEN", "WORK_SLACK_TOKEN", "DISCORD_TOKEN", "DISCORD_GUILD_ID"]:
         monkeypatch.delenv(var, raising=False)
+    yield
+    monkeypatch.undo()
+
+
+@pytest.fixture
+def png_bytes() -> bytes:
+    """Create a tiny valid PNG image."""
+    buffer = io.BytesIO()
+    Image.new("RGBA", (1, 1)).save(buffer, format="PNG")
+    return buffer.getvalue()
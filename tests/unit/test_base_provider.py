@@ -1,9 +1,30 @@
 """Tests for base provider filtering and alias resolution."""
 
+import fnmatch
+import ntpath
+import posixpath
+from collections.abc import Callable, Iterator
+from types import MappingProxyType
+from typing import cast
+
 import pytest
 
 from mkdocs_external_emojis.models import EmojiInfo, ProviderConfig, ProviderFilter, ProviderType
-from mkdocs_external_emojis.providers.base import AbstractEmojiProvider
+from mkdocs_external_emojis.providers.base import AbstractEmojiProvider, _compile_patterns
+
+SAMPLE_EMOJIS = {
+    "partyparrot": EmojiInfo.from_url("partyparrot", "https://example.com/partyparrot.gif"),
+    "catjam": EmojiInfo.from_url("catjam", "https://example.com/catjam.gif"),
+    "party_blob": EmojiInfo.from_url("party_blob", "https://example.com/party_blob.gif"),
+    "thumbsup": EmojiInfo.from_url("thumbsup", "https://example.com/thumbsup.png"),
+    "thumbsdown": EmojiInfo.from_url("thumbsdown", "https://example.com/thumbsdown.png"),
+}
+
+NUMBERED_CATS = {
+    "cat1": EmojiInfo.from_url("cat1", "https://example.com/cat1.gif"),
+    "cat2": EmojiInfo.from_url("cat2", "https://example.com/cat2.gif"),
+    "cat10": EmojiInfo.from_url("cat10", "https://example.com/cat10.gif"),
+}
 
 
 class ConcreteProvider(AbstractEmojiProvider):
@@ -22,16 +43,10 @@ class ConcreteProvider(AbstractEmojiProvider):
 class TestFilterEmojis:
     """Tests for filter_emojis method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_emojis(self) -> dict[str, EmojiInfo]:
-        """Sample emoji dictionary for testing."""
-        return {
-            "partyparrot": EmojiInfo.from_url("partyparrot", "https://example.com/partyparrot.gif"),
-            "catjam": EmojiInfo.from_url("catjam", "https://example.com/catjam.gif"),
-            "party_blob": EmojiInfo.from_url("party_blob", "https://example.com/party_blob.gif"),
-            "thumbsup": EmojiInfo.from_url("thumbsup", "https://example.com/thumbsup.png"),
-            "thumbsdown": EmojiInfo.from_url("thumbsdown", "https://example.com/thumbsdown.png"),
-        }
+        """Sample emoji dictionary for testing, read-only so tests cannot alter it."""
+        return cast("dict[str, EmojiInfo]", MappingProxyType(SAMPLE_EMOJIS))
 
     def test_no_filters_returns_all(self, sample_emojis: dict[str, EmojiInfo]) -> None:
         """Test that no filters returns all emojis."""
@@ -141,11 +156,6 @@ class TestFilterEmojis:
 
     def test_question_mark_wildcard(self) -> None:
         """Test ? wildcard matches single character."""
-        emojis = {
-            "cat1": EmojiInfo.from_url("cat1", "https://example.com/cat1.gif"),
-            "cat2": EmojiInfo.from_url("cat2", "https://example.com/cat2.gif"),
-            "cat10": EmojiInfo.from_url("cat10", "https://example.com/cat10.gif"),
-        }
         config = ProviderConfig(
             type=ProviderType.SLACK,
             namespace="test",
@@ -154,16 +164,76 @@ class TestFilterEmojis:
         )
         provider = ConcreteProvider(config)
 
-        result = provider.filter_emojis(emojis)
+        result = provider.filter_emojis(NUMBERED_CATS)
 
         # cat? matches cat1, cat2 but not cat10
         assert set(result.keys()) == {"cat1", "cat2"}
 
+    def test_character_class_pattern(self, sample_emojis: dict[str, EmojiInfo]) -> None:
+        """Test [seq] wildcard and that patterns must match the whole name."""
+        config = ProviderConfig(
+            type=ProviderType.SLACK,
+            namespace="test",
+            token_env="TOKEN",
+            filters=ProviderFilter(include_patterns=["[ct]*", "party"]),
+        )
+        provider = ConcreteProvider(config)
+
+        result = provider.filter_emojis(sample_emojis)
+
+        # "party" alone matches neither partyparrot nor party_blob
+        assert set(result.keys()) == {"catjam", "thumbsup", "thumbsdown"}
+
+    def test_patterns_changed_after_init(self, sample_emojis: dict[str, EmojiInfo]) -> None:
+        """Test that filters edited after provider creation are honored."""
+        config = ProviderConfig(
+            type=ProviderType.SLACK,
+            namespace="test",
+            token_env="TOKEN",
+        )
+        provider = ConcreteProvider(config)
+        assert provider.filter_emojis(sample_emojis) == sample_emojis
+
+        config.filters.exclude_patterns = ["thumbs*"]
+
+        result = provider.filter_emojis(sample_emojis)
+
+        assert set(result.keys()) == {"partyparrot", "catjam", "party_blob"}
+
+    @pytest.fixture
+    def clear_pattern_cache(self) -> Iterator[None]:
+        """Drop compiled patterns so a patched os.path.normcase takes effect."""
+        _compile_patterns.cache_clear()
+        yield
+        _compile_patterns.cache_clear()
+
+    @pytest.mark.parametrize("normcase", [posixpath.normcase, ntpath.normcase])
+    @pytest.mark.usefixtures("clear_pattern_cache")
+    def test_case_sensitivity_matches_fnmatch(
+        self, monkeypatch: pytest.MonkeyPatch, normcase: Callable[[str], str]
+    ) -> None:
+        """Test that patterns are case-insensitive exactly where fnmatch.fnmatch is."""
+        monkeypatch.setattr("os.path.normcase", normcase)
+        emojis = {
+            name: EmojiInfo.from_url(name, f"https://example.com/{name}.gif")
+            for name in ("PartyParrot", "partyparrot", "catjam")
+        }
+        config = ProviderConfig(
+            type=ProviderType.SLACK,
+            namespace="test",
+            token_env="TOKEN",
+            filters=ProviderFilter(include_patterns=["party*"]),
+        )
+
+        result = ConcreteProvider(config).filter_emojis(emojis)
+
+        assert set(result) == {name for name in emojis if fnmatch.fnmatch(name, "party*")}
+
 
 class TestResolveAliases:
     """Tests for resolve_aliases method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def provider(self) -> ConcreteProvider:
         """Create test provider."""
         config = ProviderConfig(
@@ -244,6 +314,32 @@ class TestResolveAliases:
         # None should be resolved since they're all circular
         assert len(result) == 0
 
+    def test_long_alias_chain(self, provider: ConcreteProvider) -> None:
+        """Test that alias chains are not cut off at an arbitrary depth."""
+        emojis = {"alias0": EmojiInfo.from_url("alias0", "https://example.com/original.gif")}
+        for i in range(1, 30):
+            emojis[f"alias{i}"] = EmojiInfo.from_alias(f"alias{i}", f"alias{i - 1}")
+
+        result = provider.resolve_aliases(emojis)
+
+        assert len(result) == 30
+        assert result["alias29"].url == "https://example.com/original.gif"
+        assert result["alias29"].name == "alias29"
+
+    def test_alias_into_cycle(self, provider: ConcreteProvider) -> None:
+        """Test that aliases leading into a cycle are dropped without affecting others."""
+        emojis = {
+            "original": EmojiInfo.from_url("original", "https://example.com/original.gif"),
+            "good": EmojiInfo.from_alias("good", "original"),
+            "entry": EmojiInfo.from_alias("entry", "a"),
+            "a": EmojiInfo.from_alias("a", "b"),
+            "b": EmojiInfo.from_alias("b", "a"),
+        }
+
+        result = provider.resolve_aliases(emojis)
+
+        assert set(result.keys()) == {"original", "good"}
+
     def test_alias_preserves_format(self, provider: ConcreteProvider) -> None:
         """Test that alias resolution preserves the format from target."""
         from mkdocs_external_emojis.models import EmojiFormat
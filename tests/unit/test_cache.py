@@ -1,5 +1,7 @@
 """Tests for EmojiCache."""
 
+import json
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -51,6 +53,50 @@ class TestEmojiCache:
         new_cache = EmojiCache(cache.config, namespace="test")
         assert new_cache.metadata == {"partyparrot": {"url": "https://example.com/partyparrot.gif"}}
 
+    def test_metadata_is_written_compactly(self, cache: EmojiCache) -> None:
+        """Test that metadata is saved without indentation and indented files still load."""
+        entry = {"url": "https://example.com/partyparrot.gif"}
+        cache.metadata = {"partyparrot": entry}
+        cache._save_metadata()
+
+        assert cache.metadata_file.read_bytes() == (
+            b'{"partyparrot":{"url":"https://example.com/partyparrot.gif"}}'
+        )
+
+        cache.metadata_file.write_text(json.dumps({"partyparrot": entry}, indent=2))
+        assert EmojiCache(cache.config, namespace="test").metadata == {"partyparrot": entry}
+
+    def test_failed_save_keeps_previous_metadata(
+        self, cache: EmojiCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a save interrupted mid-write leaves the old file intact."""
+        cache.metadata = {"partyparrot": {"url": "https://example.com/partyparrot.gif"}}
+        cache._save_metadata()
+
+        def fail(_obj: object) -> bytes:
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr("mkdocs_external_emojis.sync.cache._dumps_json", fail)
+        cache.metadata = {}
+        with pytest.raises(RuntimeError):
+            cache._save_metadata()
+
+        assert [p.name for p in cache.cache_dir.iterdir()] == [cache.METADATA_FILE]
+        assert EmojiCache(cache.config, namespace="test").metadata == {
+            "partyparrot": {"url": "https://example.com/partyparrot.gif"}
+        }
+
+    def test_save_and_load_metadata_without_orjson(
+        self, cache: EmojiCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test metadata round-trips through the stdlib json fallback."""
+        monkeypatch.setattr("mkdocs_external_emojis.sync.cache.orjson", None)
+        cache.metadata = {"partyparrot": {"url": "https://example.com/partyparrot.gif"}}
+        cache._save_metadata()
+
+        new_cache = EmojiCache(cache.config, namespace="test")
+        assert new_cache.metadata == cache.metadata
+
 
 class TestGetCachedPath:
     """Tests for _get_cached_path extension detection."""
@@ -138,6 +184,26 @@ class TestIsCached:
         cache.metadata["stale"] = {"cached_at": old_time.isoformat()}
         assert cache.is_cached(emoji) is False
 
+    def test_cached_with_timestamp(self, cache: EmojiCache) -> None:
+        """Test unix timestamps written by store() are honored."""
+        emoji = EmojiInfo(name="fresh", url="https://example.com/fresh.png")
+        (cache.cache_dir / "fresh.png").write_bytes(b"fake image")
+        cache.metadata["fresh"] = {"cached_at": time.time() - 60}
+        assert cache.is_cached(emoji) is True
+
+        cache.metadata["fresh"] = {"cached_at": time.time() - 2 * 3600}
+        assert cache.is_cached(emoji) is False
+
+    def test_not_cached_when_url_changed(self, cache: EmojiCache) -> None:
+        """Test emoji not cached when it now points at a different URL."""
+        emoji = EmojiInfo(name="fresh", url="https://example.com/fresh-v2.png")
+        (cache.cache_dir / "fresh.png").write_bytes(b"fake image")
+        cache.metadata["fresh"] = {
+            "url": "https://example.com/fresh.png",
+            "cached_at": datetime.now().isoformat(),
+        }
+        assert cache.is_cached(emoji) is False
+
     def test_cached_when_fresh(self, cache: EmojiCache) -> None:
         """Test emoji cached when file exists and TTL not expired."""
         emoji = EmojiInfo(name="fresh", url="https://example.com/fresh.png")
@@ -177,6 +243,41 @@ class TestStore:
         assert cache.metadata["new"]["size_bytes"] == 22
         assert "cached_at" in cache.metadata["new"]
 
+    def test_batched_store_writes_metadata_on_exit(self, cache: EmojiCache, tmp_path: Path) -> None:
+        """Test that stores inside a with block write metadata once at the end."""
+        source_file = tmp_path / "source.png"
+        source_file.write_bytes(b"fake image")
+
+        with cache:
+            for name in ("one", "two"):
+                emoji = EmojiInfo(name=name, url=f"https://example.com/{name}.png")
+                cache.store(emoji, source_file, size_bytes=10)
+            assert not cache.metadata_file.exists()
+
+        reloaded = EmojiCache(cache.config, namespace="test")
+        assert set(reloaded.metadata) == {"one", "two"}
+
+    def test_store_from_cache_reuses_same_url(self, cache: EmojiCache, tmp_path: Path) -> None:
+        """Test that an emoji with an already cached URL is stored without downloading."""
+        source_file = tmp_path / "source.gif"
+        source_file.write_bytes(b"GIF89a")
+        original = EmojiInfo.from_url("partyparrot", "https://example.com/partyparrot.gif")
+        cache.store(original, source_file, size_bytes=6)
+
+        alias = EmojiInfo.from_url("parrot", "https://example.com/partyparrot.gif")
+
+        assert cache.store_from_cache(alias) is True
+        assert (cache.cache_dir / "parrot.gif").read_bytes() == b"GIF89a"
+        assert cache.metadata["parrot"]["size_bytes"] == 6
+        assert cache.is_cached(alias)
+
+    def test_store_from_cache_without_match(self, cache: EmojiCache) -> None:
+        """Test that nothing is stored when no cached entry shares the URL."""
+        emoji = EmojiInfo.from_url("catjam", "https://example.com/catjam.gif")
+
+        assert cache.store_from_cache(emoji) is False
+        assert "catjam" not in cache.metadata
+
 
 class TestClean:
     """Tests for clean method."""
@@ -203,6 +304,18 @@ class TestClean:
         assert cache.metadata_file.exists()  # metadata file still exists
         assert cache.metadata == {}
 
+    def test_clean_without_loading_metadata(self, cache: EmojiCache) -> None:
+        """Test that a cache opened with load_metadata=False still cleans everything."""
+        (cache.cache_dir / "emoji1.png").write_bytes(b"img1")
+        cache.metadata = {"emoji1": {}}
+        cache._save_metadata()
+
+        unloaded = EmojiCache(cache.config, namespace="test", load_metadata=False)
+        assert unloaded.metadata == {}
+        assert unloaded.clean() == 1
+
+        assert EmojiCache(cache.config, namespace="test").metadata == {}
+
 
 class TestCleanStale:
     """Tests for clean_stale method."""
@@ -246,6 +359,25 @@ class TestCleanStale:
         assert count == 1
         assert not (cache.cache_dir / "notimestamp.png").exists()
 
+    def test_uses_recorded_format(self, cache: EmojiCache) -> None:
+        """Test that the file for a stale entry is found from its recorded format."""
+        (cache.cache_dir / "stale.gif").write_bytes(b"gif")
+        (cache.cache_dir / "stale.png").write_bytes(b"other")
+        cache.metadata = {"stale": {"format": "gif", "url": "https://example.com/a"}}
+
+        count = cache.clean_stale()
+
+        assert count == 1
+        assert not (cache.cache_dir / "stale.gif").exists()
+        assert (cache.cache_dir / "stale.png").exists()
+
+    def test_drops_entries_with_missing_files(self, cache: EmojiCache) -> None:
+        """Test that stale entries whose file is gone are removed from saved metadata."""
+        cache.metadata = {"gone": {"format": "png"}}
+
+        assert cache.clean_stale() == 0
+        assert EmojiCache(cache.config, namespace="test").metadata == {}
+
 
 class TestGetStats:
     """Tests for get_stats method."""
@@ -270,3 +402,12 @@ class TestGetStats:
         assert stats["total_files"] == 2
         assert stats["total_size_bytes"] == 3000
         assert stats["total_size_mb"] == pytest.approx(0.00, abs=0.01)
+
+    def test_counts_files_without_metadata(self, cache: EmojiCache) -> None:
+        """Test that the file count is right before any metadata has been saved."""
+        (cache.cache_dir / "emoji1.png").write_bytes(b"x" * 10)
+
+        stats = cache.get_stats()
+
+        assert stats["total_files"] == 1
+        assert stats["total_size_bytes"] == 10
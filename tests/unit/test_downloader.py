@@ -0,0 +1,183 @@
+"""Tests for emoji downloader."""
+
+from pathlib import Path
+
+import pytest
+import requests_mock
+
+from mkdocs_external_emojis.models import EmojiInfo
+from mkdocs_external_emojis.sync.downloader import DownloadError, EmojiDownloader
+
+
+class TestDownload:
+    """Tests for EmojiDownloader.download."""
+
+    def test_downloads_valid_image(self, png_bytes: bytes) -> None:
+        """Test that a valid image is written to a temp file."""
+        emoji = EmojiInfo.from_url("catjam", "https://example.com/catjam.png")
+
+        with requests_mock.Mocker() as m:
+            m.get(emoji.url, content=png_bytes)
+            path, size = EmojiDownloader().download(emoji)
+
+        try:
+            assert size == len(png_bytes)
+            assert path.read_bytes() == png_bytes
+        finally:
+            path.unlink()
+
+    @pytest.mark.parametrize("content", [b"<html>not an image</html>", b"\x89PNG\r\n\x1a\n"])
+    def test_rejects_invalid_image(
+        self, content: bytes, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that non-image or truncated content is rejected and cleaned up."""
+        monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+        emoji = EmojiInfo.from_url("broken", "https://example.com/broken.png")
+
+        with requests_mock.Mocker() as m:
+            m.get(emoji.url, content=content)
+            with pytest.raises(DownloadError, match="Invalid image file"):
+                EmojiDownloader().download(emoji)
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestDownloadIfModified:
+    """Tests for EmojiDownloader.download_if_modified."""
+
+    def test_returns_validators(self, png_bytes: bytes) -> None:
+        """Test that ETag and Last-Modified are returned for the next request."""
+        emoji = EmojiInfo.from_url("catjam", "https://example.com/catjam.png")
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                emoji.url,
+                content=png_bytes,
+                headers={"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+            )
+            downloaded = EmojiDownloader().download_if_modified(emoji)
+
+        assert downloaded is not None
+        path, _, validators = downloaded
+        path.unlink()
+        assert validators == {
+            "etag": '"abc"',
+            "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+
+    def test_not_modified(self) -> None:
+        """Test that a 304 response returns None and sends the validators."""
+        emoji = EmojiInfo.from_url("catjam", "https://example.com/catjam.png")
+
+        with requests_mock.Mocker() as m:
+            m.get(emoji.url, status_code=304)
+            downloaded = EmojiDownloader().download_if_modified(
+                emoji, etag='"abc"', last_modified="Wed, 01 Jan 2025 00:00:00 GMT"
+            )
+
+        assert downloaded is None
+        assert m.last_request.headers["If-None-Match"] == '"abc"'
+        assert m.last_request.headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    def test_streams_into_dest(self, png_bytes: bytes, tmp_path: Path) -> None:
+        """Test that the image is written to dest without leaving a partial file."""
+        emoji = EmojiInfo.from_url("catjam", "https://example.com/catjam.png")
+        dest = tmp_path / "catjam.png"
+
+        with requests_mock.Mocker() as m:
+            m.get(emoji.url, content=png_bytes)
+            downloaded = EmojiDownloader().download_if_modified(emoji, dest=dest)
+
+        assert downloaded is not None
+        assert downloaded[0] == dest
+        assert [p.name for p in tmp_path.iterdir()] == ["catjam.png"]
+        assert dest.read_bytes() == png_bytes
+
+    def test_failed_download_keeps_existing_dest(self, tmp_path: Path) -> None:
+        """Test that an invalid download leaves the previous file at dest untouched."""
+        emoji = EmojiInfo.from_url("catjam", "https://example.com/catjam.png")
+        dest = tmp_path / "catjam.png"
+        dest.write_bytes(b"old")
+
+        with requests_mock.Mocker() as m:
+            m.get(emoji.url, content=b"<html>not an image</html>")
+            with pytest.raises(DownloadError, match="Invalid image file"):
+                EmojiDownloader().download_if_modified(emoji, dest=dest)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["catjam.png"]
+        assert dest.read_bytes() == b"old"
+
+    def test_magic_only_checks_signature(self, tmp_path: Path) -> None:
+        """Test that magic_only accepts known signatures (but not any RIFF file) without parsing."""
+        emoji = EmojiInfo.from_url("catjam", "https://example.com/catjam.gif")
+        downloader = EmojiDownloader()
+
+        with requests_mock.Mocker() as m:
+            m.get(emoji.url, content=b"GIF89a truncated")
+            downloaded = downloader.download_if_modified(
+                emoji, dest=tmp_path / "catjam.gif", magic_only=True
+            )
+            assert downloaded is not None
+
+            m.get(emoji.url, content=b"RIFF\x24\x00\x00\x00WEBPVP8 ")
+            downloaded = downloader.download_if_modified(
+                emoji, dest=tmp_path / "catjam.webp", magic_only=True
+            )
+            assert downloaded is not None
+
+            for content in (b"<html>not an image</html>", b"RIFF\x24\x00\x00\x00WAVEfmt "):
+                m.get(emoji.url, content=content)
+                with pytest.raises(DownloadError, match="Invalid image file"):
+                    downloader.download_if_modified(
+                        emoji, dest=tmp_path / "broken.gif", magic_only=True
+                    )
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["catjam.gif", "catjam.webp"]
+
+
+class TestDownloadMultiple:
+    """Tests for EmojiDownloader.download_multiple."""
+
+    def test_downloads_all_in_input_order(self, png_bytes: bytes) -> None:
+        """Test that every emoji is downloaded and results keep input order."""
+        emojis = [
+            EmojiInfo.from_url(f"emoji{i}", f"https://example.com/emoji{i}.png") for i in range(10)
+        ]
+        progress: list[int] = []
+
+        with requests_mock.Mocker() as m:
+            for emoji in emojis:
+                m.get(emoji.url, content=png_bytes)
+
+            results = EmojiDownloader(max_workers=4).download_multiple(
+                emojis, progress_callback=lambda _name, current, _total: progress.append(current)
+            )
+
+        try:
+            assert [*results] == [emoji.name for emoji in emojis]
+            assert all(size == len(png_bytes) for _, size in results.values())
+            assert progress == list(range(1, 11))
+        finally:
+            for path, _ in results.values():
+                path.unlink()
+
+    def test_failed_download_is_skipped(self, png_bytes: bytes) -> None:
+        """Test that a failed download does not stop the others."""
+        good = EmojiInfo.from_url("good", "https://example.com/good.png")
+        bad = EmojiInfo.from_url("bad", "https://example.com/bad.png")
+
+        with requests_mock.Mocker() as m:
+            m.get(good.url, content=png_bytes)
+            m.get(bad.url, status_code=404)
+
+            results = EmojiDownloader().download_multiple([bad, good])
+
+        try:
+            assert [*results] == ["good"]
+        finally:
+            for path, _ in results.values():
+                path.unlink()
+
+    def test_empty_list(self) -> None:
+        """Test that no emojis means no downloads."""
+        assert EmojiDownloader().download_multiple([]) == {}
@@ -1,14 +1,17 @@
 """Tests for emoji index and generator."""
 
+import os
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 from xml.etree.ElementTree import Element
 
 import pytest
+from markdown import Markdown
 
 from mkdocs_external_emojis.emoji_index import (
     _MD_CONFIG_ATTR,
     EmojiIndexConfig,
+    _scan_emoji_files,
     create_custom_emoji_index,
     custom_emoji_generator,
 )
@@ -28,14 +31,14 @@ class TestCustomEmojiGenerator:
     """Tests for custom_emoji_generator function."""
 
     @pytest.fixture
-    def md_with_config(self) -> MagicMock:
-        """Create a mock Markdown instance with emoji config."""
-        md = MagicMock()
+    def md_with_config(self) -> Markdown:
+        """Create a Markdown instance with emoji config."""
+        md = Markdown()
         config = EmojiIndexConfig()
         setattr(md, _MD_CONFIG_ATTR, config)
         return md
 
-    def test_generates_img_element_for_custom_emoji(self, md_with_config: MagicMock) -> None:
+    def test_generates_img_element_for_custom_emoji(self, md_with_config: Markdown) -> None:
         """Test that custom emojis generate img elements."""
         # Register a custom emoji path
         config = getattr(md_with_config, _MD_CONFIG_ATTR)
@@ -60,7 +63,7 @@ class TestCustomEmojiGenerator:
         assert element.get("alt") == ":partyparrot:"
         assert element.get("title") == ":partyparrot:"
 
-    def test_handles_namespaced_emoji(self, md_with_config: MagicMock) -> None:
+    def test_handles_namespaced_emoji(self, md_with_config: Markdown) -> None:
         """Test that namespaced emojis work correctly."""
         config = getattr(md_with_config, _MD_CONFIG_ATTR)
         config.emoji_paths["slack-partyparrot"] = "assets/emojis/slack/partyparrot.gif"
@@ -83,7 +86,7 @@ class TestCustomEmojiGenerator:
     def test_falls_back_to_standard_emoji(self) -> None:
         """Test that unknown emojis fall back to standard generator."""
         # md without config - should fall back to standard
-        md = MagicMock()
+        md = Markdown()
 
         with patch("mkdocs_external_emojis.emoji_index.to_svg") as mock_to_svg:
             mock_element = Element("span")
@@ -130,7 +133,7 @@ class TestCreateCustomEmojiIndex:
         with patch("mkdocs_external_emojis.emoji_index.twemoji") as mock_twemoji:
             mock_twemoji.return_value = {"emoji": {}, "alias": {}}
 
-            index = create_custom_emoji_index(icons_dir, {}, MagicMock())
+            index = create_custom_emoji_index(icons_dir, {}, Markdown())
 
             # Should have both prefixed and unprefixed versions
             assert ":slack-partyparrot:" in index["emoji"]
@@ -138,19 +141,32 @@ class TestCreateCustomEmojiIndex:
             assert ":slack-catjam:" in index["emoji"]
             assert ":catjam:" in index["emoji"]
 
+    def test_custom_entries_match_pymdownx_format(self, icons_dir: Path) -> None:
+        """Test that custom index entries read like pymdownx.emoji entry dicts."""
+        with patch("mkdocs_external_emojis.emoji_index.twemoji") as mock_twemoji:
+            mock_twemoji.return_value = {"emoji": {}, "alias": {}}
+
+            index = create_custom_emoji_index(icons_dir, {}, Markdown())
+
+        entry = index["emoji"][":slack-partyparrot:"]
+        assert entry == {"name": "slack-partyparrot", "unicode": "e000", "category": "custom"}
+        assert entry["name"] == "slack-partyparrot"
+        assert entry.get("unicode") == "e000"
+        assert entry.get("unicode_alt", "fallback") == "fallback"
+
     def test_skips_hidden_files(self, icons_dir: Path) -> None:
         """Test that hidden files are skipped."""
         with patch("mkdocs_external_emojis.emoji_index.twemoji") as mock_twemoji:
             mock_twemoji.return_value = {"emoji": {}, "alias": {}}
 
-            index = create_custom_emoji_index(icons_dir, {}, MagicMock())
+            index = create_custom_emoji_index(icons_dir, {}, Markdown())
 
             assert ":hidden:" not in index["emoji"]
             assert ":.hidden:" not in index["emoji"]
 
     def test_stores_emoji_paths_on_md_instance(self, icons_dir: Path) -> None:
         """Test that emoji paths are stored on md instance."""
-        md = MagicMock()
+        md = Markdown()
 
         with patch("mkdocs_external_emojis.emoji_index.twemoji") as mock_twemoji:
             mock_twemoji.return_value = {"emoji": {}, "alias": {}}
@@ -163,13 +179,40 @@ class TestCreateCustomEmojiIndex:
             assert "partyparrot" in config.emoji_paths
             assert config.emoji_paths["slack-partyparrot"] == "assets/emojis/slack/partyparrot.gif"
 
+    def test_skips_nested_directories_and_top_level_files(self, icons_dir: Path) -> None:
+        """Test that only files inside namespace directories are indexed."""
+        (icons_dir / "slack" / "nested").mkdir()
+        (icons_dir / "stray.png").write_bytes(b"PNG")
+
+        with patch("mkdocs_external_emojis.emoji_index.twemoji") as mock_twemoji:
+            mock_twemoji.return_value = {"emoji": {}, "alias": {}}
+
+            index = create_custom_emoji_index(icons_dir, {}, Markdown())
+
+            assert ":slack-nested:" not in index["emoji"]
+            assert ":stray:" not in index["emoji"]
+            assert ":slack-partyparrot:" in index["emoji"]
+
+    def test_strips_only_last_extension(self, icons_dir: Path) -> None:
+        """Test that emoji names keep inner dots and extensionless files keep their name."""
+        (icons_dir / "slack" / "v1.2.png").write_bytes(b"PNG")
+        (icons_dir / "slack" / "noext").write_bytes(b"PNG")
+
+        with patch("mkdocs_external_emojis.emoji_index.twemoji") as mock_twemoji:
+            mock_twemoji.return_value = {"emoji": {}, "alias": {}}
+
+            index = create_custom_emoji_index(icons_dir, {}, Markdown())
+
+            assert ":slack-v1.2:" in index["emoji"]
+            assert ":slack-noext:" in index["emoji"]
+
     def test_namespace_prefix_required(self, icons_dir: Path) -> None:
         """Test that namespace prefix can be required."""
         with patch("mkdocs_external_emojis.emoji_index.twemoji") as mock_twemoji:
             mock_twemoji.return_value = {"emoji": {}, "alias": {}}
 
             index = create_custom_emoji_index(
-                icons_dir, {}, MagicMock(), namespace_prefix_required=True
+                icons_dir, {}, Markdown(), namespace_prefix_required=True
             )
 
             # Should only have prefixed versions
@@ -183,7 +226,7 @@ class TestCreateCustomEmojiIndex:
         with patch("mkdocs_external_emojis.emoji_index.twemoji") as mock_twemoji:
             mock_twemoji.return_value = {"emoji": {}, "alias": {}}
 
-            index = create_custom_emoji_index(nonexistent, {}, MagicMock())
+            index = create_custom_emoji_index(nonexistent, {}, Markdown())
 
             # Should return base index without errors
             assert index == {"emoji": {}, "alias": {}}
@@ -205,14 +248,68 @@ class TestCreateCustomEmojiIndex:
         with patch("mkdocs_external_emojis.emoji_index.twemoji") as mock_twemoji:
             mock_twemoji.return_value = {"emoji": {}, "alias": {}}
 
-            index = create_custom_emoji_index(icons, {}, MagicMock())
+            index = create_custom_emoji_index(icons, {}, Markdown())
 
             assert ":slack-emoji1:" in index["emoji"]
             assert ":discord-emoji2:" in index["emoji"]
 
+    def test_unprefixed_name_clash_keeps_first_namespace(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a name shared by two namespaces resolves to the first one and warns."""
+        icons = tmp_path / "icons"
+        for namespace in ("slack", "discord"):
+            (icons / namespace).mkdir(parents=True)
+            (icons / namespace / "party.gif").write_bytes(b"GIF89a")
+
+        md = Markdown()
+        with patch("mkdocs_external_emojis.emoji_index.twemoji") as mock_twemoji:
+            mock_twemoji.return_value = {"emoji": {}, "alias": {}}
+
+            with caplog.at_level("WARNING"):
+                index = create_custom_emoji_index(icons, {}, md)
+
+        config = getattr(md, _MD_CONFIG_ATTR)
+        assert config.emoji_paths["party"] == "assets/emojis/discord/party.gif"
+        assert config.emoji_paths["slack-party"] == "assets/emojis/slack/party.gif"
+        assert ":slack-party:" in index["emoji"]
+        assert "exists in namespaces 'discord' and 'slack'" in caplog.text
+
+    def test_unchanged_directory_is_not_rescanned(self, icons_dir: Path) -> None:
+        """Test that later indexes of an unchanged directory reuse the first scan."""
+        with (
+            patch("mkdocs_external_emojis.emoji_index.twemoji") as mock_twemoji,
+            patch(
+                "mkdocs_external_emojis.emoji_index._scan_emoji_files",
+                wraps=_scan_emoji_files,
+            ) as scan,
+        ):
+            mock_twemoji.side_effect = lambda *_: {"emoji": {}, "alias": {}}
+
+            create_custom_emoji_index(icons_dir, {}, Markdown())
+            index = create_custom_emoji_index(icons_dir, {}, Markdown())
+
+        assert scan.call_count == 1
+        assert ":slack-partyparrot:" in index["emoji"]
+
+    def test_changed_namespace_is_rescanned(self, icons_dir: Path) -> None:
+        """Test that files added to a namespace appear in the next index."""
+        with patch("mkdocs_external_emojis.emoji_index.twemoji") as mock_twemoji:
+            mock_twemoji.side_effect = lambda *_: {"emoji": {}, "alias": {}}
+
+            create_custom_emoji_index(icons_dir, {}, Markdown())
+            slack_dir = icons_dir / "slack"
+            (slack_dir / "dance.gif").write_bytes(b"GIF89a")
+            # Make the mtime change visible even on coarse-grained filesystems
+            mtime_ns = slack_dir.stat().st_mtime_ns + 1_000_000_000
+            os.utime(slack_dir, ns=(mtime_ns, mtime_ns))
+            index = create_custom_emoji_index(icons_dir, {}, Markdown())
+
+        assert ":slack-dance:" in index["emoji"]
+
     def test_config_stored_on_md_instance(self, icons_dir: Path) -> None:
         """Test that config is stored on md instance."""
-        md = MagicMock()
+        md = Markdown()
 
         with patch("mkdocs_external_emojis.emoji_index.twemoji") as mock_twemoji:
             mock_twemoji.return_value = {"emoji": {}, "alias": {}}
@@ -0,0 +1,33 @@
+"""Tests for the shared HTTP session."""
+
+from requests.adapters import HTTPAdapter
+
+from mkdocs_external_emojis.constants import MAX_DOWNLOAD_WORKERS, MAX_PROVIDER_WORKERS
+from mkdocs_external_emojis.http import get_session
+from mkdocs_external_emojis.sync.downloader import EmojiDownloader
+
+
+class TestGetSession:
+    """Tests for get_session."""
+
+    def test_session_is_shared(self) -> None:
+        """Test that providers and downloaders reuse one session."""
+        assert get_session() is get_session()
+        assert EmojiDownloader().session is get_session()
+
+    def test_retries_transient_errors(self) -> None:
+        """Test that the session retries rate limits and server errors."""
+        adapter = get_session().get_adapter("https://cdn.discordapp.com")
+        assert isinstance(adapter, HTTPAdapter)
+        retries = adapter.max_retries
+
+        assert retries.total == 3
+        assert 429 in retries.status_forcelist
+        assert 503 in retries.status_forcelist
+
+    def test_pool_fits_concurrent_requests(self) -> None:
+        """Test that the connection pool keeps every concurrent request's connection."""
+        adapter = get_session().get_adapter("https://emoji.slack-edge.com")
+        assert isinstance(adapter, HTTPAdapter)
+
+        assert adapter._pool_maxsize >= MAX_DOWNLOAD_WORKERS + MAX_PROVIDER_WORKERS
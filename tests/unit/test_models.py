@@ -1,6 +1,11 @@
 """Tests for data models."""
 
+import dataclasses
+
+import pytest
+
 from mkdocs_external_emojis.models import (
+    EmojiConfig,
     EmojiFormat,
     EmojiInfo,
     EmojiOptions,
@@ -21,18 +26,40 @@ class TestEmojiInfo:
         assert emoji.format == EmojiFormat.PNG
         assert not emoji.is_alias
 
-    def test_from_url_detects_format(self) -> None:
-        """Test format detection from URL."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("url", "expected_format"),
+        [
             ("https://example.com/emoji.svg", EmojiFormat.SVG),
             ("https://example.com/emoji.png", EmojiFormat.PNG),
             ("https://example.com/emoji.gif", EmojiFormat.GIF),
             ("https://example.com/emoji.jpg", EmojiFormat.JPG),
-        ]
-
-        for url, expected_format in test_cases:
-            emoji = EmojiInfo.from_url("test", url)
-            assert emoji.format == expected_format
+        ],
+    )
+    def test_from_url_detects_format(self, url: str, expected_format: EmojiFormat) -> None:
+        """Test format detection from URL."""
+        assert EmojiInfo.from_url("test", url).format == expected_format
+
+    @pytest.mark.parametrize(
+        ("url", "expected_format"),
+        [
+            ("https://example.com/emoji.GIF", EmojiFormat.GIF),
+            ("https://example.com/emoji.webp?v=1", EmojiFormat.WEBP),
+            ("https://example.com/emoji.png#frag", EmojiFormat.PNG),
+            ("https://example.com/emoji.gif?fallback=x.png", EmojiFormat.GIF),
+            ("https://example.com/emoji.png/", EmojiFormat.PNG),
+            ("https://example.com/emoji.png/raw", None),
+            ("https://example.com/emoji", None),
+            ("https://example.com/emoji.bmp", None),
+            ("https://cdn.png", None),
+            ("https://cdn.png/", None),
+            ("https://cdn.gif/emoji", None),
+        ],
+    )
+    def test_from_url_ignores_query_fragment_and_case(
+        self, url: str, expected_format: EmojiFormat | None
+    ) -> None:
+        """Test format detection only looks at the final extension of the URL path, not the host."""
+        assert EmojiInfo.from_url("test", url).format == expected_format
 
     def test_from_alias(self) -> None:
         """Test creating EmojiInfo for alias."""
@@ -43,6 +70,13 @@ class TestEmojiInfo:
         assert emoji.alias_of == "target"
         assert emoji.is_alias
 
+    def test_is_immutable(self) -> None:
+        """Test EmojiInfo is frozen so instances can be shared between aliases."""
+        emoji = EmojiInfo.from_url("test", "https://example.com/emoji.png")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            emoji.url = "https://example.com/other.png"  # type: ignore
+
     def test_is_alias(self) -> None:
         """Test is_alias property."""
         regular = EmojiInfo.from_url("regular", "https://example.com/test.png")
@@ -88,6 +122,13 @@ class TestEmojiOptions:
         result = options.format_emoji_name("slack", "partyparrot")
         assert result == "slack-partyparrot"
 
+    def test_format_emoji_name_is_interned(self) -> None:
+        """Test formatted names share one string object across calls."""
+        options = EmojiOptions()
+        first = options.format_emoji_name("slack", "partyparrot")
+        second = options.format_emoji_name("slack", "partyparrot")
+        assert first is second
+
     def test_namespace_prefix_required_default(self) -> None:
         """Test namespace_prefix_required defaults to False."""
         options = EmojiOptions()
@@ -97,3 +138,46 @@ class TestEmojiOptions:
         """Test namespace_prefix_required can be set to True."""
         options = EmojiOptions(namespace_prefix_required=True)
         assert options.namespace_prefix_required is True
+
+
+class TestEmojiConfig:
+    """Tests for EmojiConfig model."""
+
+    def test_get_provider_by_namespace(self) -> None:
+        """Test provider lookup by namespace."""
+        config = EmojiConfig(
+            providers=[
+                ProviderConfig(type=ProviderType.SLACK, namespace="slack", token_env="SLACK_TOKEN"),
+                ProviderConfig(
+                    type=ProviderType.SLACK, namespace="work", token_env="WORK_SLACK_TOKEN"
+                ),
+            ]
+        )
+
+        work = config.get_provider_by_namespace("work")
+        assert work is config.providers[1]
+        assert config.providers_by_namespace == {
+            "slack": config.providers[0],
+            "work": config.providers[1],
+        }
+        assert config.get_provider_by_namespace("missing") is None
+
+    def test_get_enabled_providers(self) -> None:
+        """Test enabled providers are returned in config order."""
+        config = EmojiConfig(
+            providers=[
+                ProviderConfig(type=ProviderType.SLACK, namespace="slack", token_env="SLACK_TOKEN"),
+                ProviderConfig(
+                    type=ProviderType.SLACK, namespace="old", token_env="OLD_TOKEN", enabled=False
+                ),
+                ProviderConfig(
+                    type=ProviderType.SLACK, namespace="work", token_env="WORK_SLACK_TOKEN"
+                ),
+            ]
+        )
+
+        enabled = config.get_enabled_providers()
+
+        assert enabled == [config.providers[0], config.providers[2]]
+        enabled.clear()
+        assert len(config.get_enabled_providers()) == 2
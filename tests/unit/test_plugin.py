@@ -0,0 +1,132 @@
+"""Tests for the MkDocs plugin."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from mkdocs.structure.files import Files
+
+from mkdocs_external_emojis.models import EmojiConfig, ProviderConfig, ProviderType, SyncResult
+from mkdocs_external_emojis.plugin import ExternalEmojisPlugin
+from mkdocs_external_emojis.providers import ProviderError
+
+
+def _fake_provider(config: ProviderConfig) -> MagicMock:
+    """Create a mock provider for a provider config."""
+    return MagicMock(config=config)
+
+
+class TestOnFiles:
+    """Tests for on_files emoji registration."""
+
+    @pytest.fixture
+    def icons_dir(self, tmp_path: Path) -> Path:
+        """Create an icons directory with a few emojis."""
+        icons_dir = tmp_path / "overrides" / "assets" / "emojis"
+        (icons_dir / "slack").mkdir(parents=True)
+        (icons_dir / "slack" / "partyparrot.gif").write_bytes(b"GIF89a")
+        (icons_dir / "slack" / ".hidden.png").write_bytes(b"x")
+        (icons_dir / ".git").mkdir()
+        (icons_dir / ".git" / "HEAD").write_text("ref")
+        return icons_dir
+
+    @pytest.fixture
+    def plugin(self, icons_dir: Path) -> ExternalEmojisPlugin:
+        """Create a plugin pointing at the icons directory."""
+        plugin = ExternalEmojisPlugin()
+        plugin.load_config({"icons_dir": str(icons_dir)})
+        return plugin
+
+    def test_registers_visible_files(self, plugin: ExternalEmojisPlugin, tmp_path: Path) -> None:
+        """Test that emoji files are registered and hidden entries skipped."""
+        files = plugin.on_files(Files([]), {"site_dir": str(tmp_path / "site")})
+
+        assert [f.src_uri for f in files] == ["assets/emojis/slack/partyparrot.gif"]
+
+    def test_registers_symlinked_files(
+        self, plugin: ExternalEmojisPlugin, icons_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test that symlinked emoji files are registered like regular ones."""
+        target = tmp_path / "catjam.png"
+        target.write_bytes(b"PNG")
+        (icons_dir / "slack" / "catjam.png").symlink_to(target)
+
+        files = plugin.on_files(Files([]), {"site_dir": str(tmp_path / "site")})
+
+        assert sorted(f.src_uri for f in files) == [
+            "assets/emojis/slack/catjam.png",
+            "assets/emojis/slack/partyparrot.gif",
+        ]
+
+    def test_picks_up_new_files_between_builds(
+        self, plugin: ExternalEmojisPlugin, icons_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test that each build gets new File objects, including newly synced emojis."""
+        config = {"site_dir": str(tmp_path / "site")}
+        first = [*plugin.on_files(Files([]), config)]
+
+        (icons_dir / "slack" / "catjam.png").write_bytes(b"PNG")
+        second = [*plugin.on_files(Files([]), config)]
+
+        assert sorted(f.src_uri for f in second) == [
+            "assets/emojis/slack/catjam.png",
+            "assets/emojis/slack/partyparrot.gif",
+        ]
+        assert not any(f is g for f in second for g in first)
+
+
+class TestOnPreBuild:
+    """Tests for on_pre_build provider syncing."""
+
+    @pytest.fixture
+    def sync_manager(self) -> MagicMock:
+        """Create a sync manager mock whose "work" provider fails."""
+
+        def sync_provider(provider: MagicMock) -> SyncResult:
+            if provider.config.namespace == "work":
+                raise RuntimeError("boom")
+            return SyncResult("slack", "slack", total_emojis=1, synced=1, cached=0, skipped=0)
+
+        sync_manager = MagicMock()
+        sync_manager.sync_provider.side_effect = sync_provider
+        return sync_manager
+
+    @pytest.fixture
+    def plugin(self, sync_manager: MagicMock) -> ExternalEmojisPlugin:
+        """Create a plugin with two providers and a mocked sync manager."""
+        plugin = ExternalEmojisPlugin()
+        plugin.load_config({"fail_on_error": False})
+        plugin.emoji_config = EmojiConfig(
+            providers=[
+                ProviderConfig(type=ProviderType.SLACK, namespace="slack", token_env="SLACK_TOKEN"),
+                ProviderConfig(
+                    type=ProviderType.SLACK, namespace="work", token_env="WORK_SLACK_TOKEN"
+                ),
+            ]
+        )
+        plugin.sync_manager = sync_manager
+        return plugin
+
+    def test_syncs_every_provider(
+        self, plugin: ExternalEmojisPlugin, sync_manager: MagicMock
+    ) -> None:
+        """Test that one failing provider does not stop the others."""
+        with patch("mkdocs_external_emojis.plugin.create_provider", side_effect=_fake_provider):
+            plugin.on_pre_build({})
+
+        synced = {c.args[0].config.namespace for c in sync_manager.sync_provider.call_args_list}
+        assert synced == {"slack", "work"}
+
+    def test_fail_on_error_raises_after_sync(
+        self, plugin: ExternalEmojisPlugin, sync_manager: MagicMock
+    ) -> None:
+        """Test that sync failures are raised when fail_on_error is set."""
+        plugin.config.fail_on_error = True
+
+        with (
+            patch("mkdocs_external_emojis.plugin.create_provider", side_effect=_fake_provider),
+            pytest.raises(ProviderError, match="Failed to sync work: boom"),
+        ):
+            plugin.on_pre_build({})
+
+        assert sync_manager.sync_provider.call_count == 2
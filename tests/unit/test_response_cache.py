@@ -0,0 +1,85 @@
+"""Tests for the provider response cache."""
+
+from pathlib import Path
+
+import pytest
+import requests
+import requests_mock
+
+from mkdocs_external_emojis.providers import ProviderError
+from mkdocs_external_emojis.sync.response_cache import ResponseCache
+
+URL = "https://slack.com/api/emoji.list"
+BODY = {"ok": True, "emoji": {"partyparrot": "https://example.com/partyparrot.gif"}}
+
+
+class TestGetJson:
+    """Tests for ResponseCache.get_json."""
+
+    def test_fresh_response_is_reused(self, tmp_path: Path) -> None:
+        """Test that a response within max_age is returned without a request."""
+        cache = ResponseCache(tmp_path / ".provider_response.slack.json")
+
+        with requests_mock.Mocker() as m:
+            m.get(URL, json=BODY)
+            first = cache.get_json(requests.Session(), URL, {}, timeout=30)
+            second = cache.get_json(requests.Session(), URL, {}, timeout=30)
+
+        assert first == second == BODY
+        assert m.call_count == 1
+
+    def test_stale_response_is_revalidated(self, tmp_path: Path) -> None:
+        """Test that an expired response is revalidated with its ETag."""
+        path = tmp_path / ".provider_response.slack.json"
+
+        with requests_mock.Mocker() as m:
+            m.get(URL, json=BODY, headers={"ETag": '"v1"'})
+            ResponseCache(path).get_json(requests.Session(), URL, {}, timeout=30)
+
+            m.get(URL, status_code=304)
+            body = ResponseCache(path, max_age=0).get_json(requests.Session(), URL, {}, timeout=30)
+
+        assert body == BODY
+        assert m.last_request.headers["If-None-Match"] == '"v1"'
+
+    def test_changed_token_is_a_miss(self, tmp_path: Path) -> None:
+        """Test that a response fetched with another token is not reused."""
+        cache = ResponseCache(tmp_path / ".provider_response.slack.json")
+        other = {"ok": True, "emoji": {"catjam": "https://example.com/catjam.gif"}}
+
+        with requests_mock.Mocker() as m:
+            m.get(URL, json=BODY, headers={"ETag": '"v1"'})
+            cache.get_json(requests.Session(), URL, {"Authorization": "Bearer a"}, timeout=30)
+
+            m.get(URL, json=other)
+            body = cache.get_json(
+                requests.Session(), URL, {"Authorization": "Bearer b"}, timeout=30
+            )
+
+        assert body == other
+        assert m.call_count == 2
+        assert "If-None-Match" not in m.last_request.headers
+        assert "Bearer" not in cache.path.read_text()
+
+    def test_uncacheable_response_is_not_stored(self, tmp_path: Path) -> None:
+        """Test that responses rejected by cacheable are fetched again next time."""
+        cache = ResponseCache(tmp_path / ".provider_response.slack.json")
+
+        with requests_mock.Mocker() as m:
+            m.get(URL, json={"ok": False, "error": "invalid_auth"})
+            for _ in range(2):
+                cache.get_json(requests.Session(), URL, {}, timeout=30, cacheable=lambda b: b["ok"])
+
+        assert m.call_count == 2
+        assert not cache.path.exists()
+
+    def test_malformed_body_raises_provider_error(self, tmp_path: Path) -> None:
+        """Test that a body that is not JSON surfaces as a ProviderError."""
+        cache = ResponseCache(tmp_path / ".provider_response.slack.json")
+
+        with requests_mock.Mocker() as m:
+            m.get(URL, text="<html>Bad gateway</html>")
+            with pytest.raises(ProviderError, match="Invalid JSON response"):
+                cache.get_json(requests.Session(), URL, {}, timeout=30)
+
+        assert not cache.path.exists()
@@ -0,0 +1,224 @@
+"""Tests for SyncManager."""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests_mock
+
+from mkdocs_external_emojis.constants import MAX_DOWNLOAD_WORKERS
+from mkdocs_external_emojis.models import CacheConfig, EmojiInfo, EmojiOptions
+from mkdocs_external_emojis.sync import SyncManager
+from mkdocs_external_emojis.sync.cache import EmojiCache
+
+PARTYPARROT = EmojiInfo.from_url("partyparrot", "https://example.com/partyparrot.gif")
+
+
+class TestSyncToIcons:
+    """Tests for publishing cached emojis to the icons directory."""
+
+    @pytest.fixture
+    def manager(self, tmp_path: Path) -> SyncManager:
+        """Create a sync manager with temporary directories."""
+        return SyncManager(
+            cache_config=CacheConfig(directory=tmp_path / "cache"),
+            emoji_options=EmojiOptions(),
+            icons_dir=tmp_path / "icons",
+        )
+
+    @pytest.fixture
+    def cache(self, manager: SyncManager, tmp_path: Path) -> EmojiCache:
+        """Create a cache holding one emoji."""
+        cache = EmojiCache(manager.cache_config, "slack")
+        source = tmp_path / "source.gif"
+        source.write_bytes(b"GIF89a")
+        cache.store(PARTYPARROT, source, 6)
+        return cache
+
+    def test_publishes_cached_files(self, manager: SyncManager, cache: EmojiCache) -> None:
+        """Test that cached emojis appear in the icons directory without metadata."""
+        manager._sync_to_icons(cache, "slack")
+
+        published = manager.icons_dir / "slack"
+        assert sorted(p.name for p in published.iterdir()) == ["partyparrot.gif"]
+        assert (published / "partyparrot.gif").read_bytes() == b"GIF89a"
+
+    def test_unchanged_files_are_left_alone(self, manager: SyncManager, cache: EmojiCache) -> None:
+        """Test that a later sync with nothing stored does not replace icons."""
+        manager._sync_to_icons(cache, "slack")
+        dest = manager.icons_dir / "slack" / "partyparrot.gif"
+        dest.unlink()
+        dest.write_bytes(b"GIF89a")
+        before = dest.stat()
+
+        manager._sync_to_icons(EmojiCache(manager.cache_config, "slack"), "slack")
+
+        assert os.path.samestat(before, dest.stat())
+
+    def test_missing_icons_are_restored(self, manager: SyncManager, cache: EmojiCache) -> None:
+        """Test that icons deleted from the icons directory are published again."""
+        manager._sync_to_icons(cache, "slack")
+        dest = manager.icons_dir / "slack" / "partyparrot.gif"
+        dest.unlink()
+
+        manager._sync_to_icons(EmojiCache(manager.cache_config, "slack"), "slack")
+
+        assert dest.read_bytes() == b"GIF89a"
+
+    def test_stored_emoji_is_republished(
+        self, manager: SyncManager, cache: EmojiCache, tmp_path: Path
+    ) -> None:
+        """Test that an emoji stored again reaches the icons directory."""
+        manager._sync_to_icons(cache, "slack")
+
+        source = tmp_path / "updated.gif"
+        source.write_bytes(b"GIF89a updated")
+        cache = EmojiCache(manager.cache_config, "slack")
+        cache.store(PARTYPARROT, source, 14)
+        manager._sync_to_icons(cache, "slack")
+
+        assert (manager.icons_dir / "slack" / "partyparrot.gif").read_bytes() == b"GIF89a updated"
+
+
+class TestSyncProvider:
+    """Tests for SyncManager.sync_provider."""
+
+    @pytest.fixture
+    def manager(self, tmp_path: Path) -> SyncManager:
+        """Create a sync manager with a one hour TTL."""
+        return SyncManager(
+            cache_config=CacheConfig(directory=tmp_path / "cache", ttl_hours=1),
+            emoji_options=EmojiOptions(),
+            icons_dir=tmp_path / "icons",
+        )
+
+    @pytest.fixture
+    def provider(self) -> MagicMock:
+        """Create a mock provider returning one emoji."""
+        provider = MagicMock()
+        provider.TRUSTED_IMAGES = False
+        provider.config.namespace = "slack"
+        provider.config.type.value = "slack"
+        provider.fetch_emojis.return_value = {"partyparrot": PARTYPARROT}
+        return provider
+
+    def test_stale_unchanged_emoji_is_revalidated(
+        self, manager: SyncManager, provider: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that a stale emoji answered with 304 is kept instead of downloaded."""
+        source = tmp_path / "source.gif"
+        source.write_bytes(b"GIF89a")
+        cache = EmojiCache(manager.cache_config, "slack")
+        cache.store(PARTYPARROT, source, 6, {"etag": '"v1"'})
+        cache.metadata["partyparrot"]["cached_at"] = time.time() - 2 * 3600
+        cache._save_metadata()
+
+        with requests_mock.Mocker() as m:
+            m.get(PARTYPARROT.url, status_code=304)
+            result = manager.sync_provider(provider)
+
+        assert m.last_request.headers["If-None-Match"] == '"v1"'
+        assert (result.synced, result.cached) == (0, 1)
+        assert EmojiCache(manager.cache_config, "slack").is_cached(PARTYPARROT)
+
+    def test_stale_unchanged_shared_image_is_reused(
+        self, manager: SyncManager, provider: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that emojis sharing a revalidated image are all kept after a 304."""
+        url = "https://example.com/shared.gif"
+        emojis = {name: EmojiInfo.from_url(name, url) for name in ("a", "b")}
+        provider.fetch_emojis.return_value = emojis
+        source = tmp_path / "source.gif"
+        source.write_bytes(b"GIF89a")
+        cache = EmojiCache(manager.cache_config, "slack")
+        for emoji in emojis.values():
+            cache.store(emoji, source, 6, {"etag": '"v1"'})
+            cache.metadata[emoji.name]["cached_at"] = time.time() - 2 * 3600
+        cache._save_metadata()
+
+        with requests_mock.Mocker() as m:
+            m.get(url, status_code=304)
+            result = manager.sync_provider(provider)
+
+        assert m.call_count == 1
+        assert (result.synced, result.cached, result.skipped) == (0, 2, 0)
+        assert result.errors == []
+        cache = EmojiCache(manager.cache_config, "slack")
+        assert all(cache.is_cached(emoji) for emoji in emojis.values())
+
+    def test_downloads_each_url_once(
+        self, manager: SyncManager, provider: MagicMock, png_bytes: bytes
+    ) -> None:
+        """Test that emojis sharing an image are downloaded once and all stored."""
+        provider.fetch_emojis.return_value = {
+            "catjam": EmojiInfo.from_url("catjam", "https://example.com/catjam.png"),
+            "jamcat": EmojiInfo.from_url("jamcat", "https://example.com/catjam.png"),
+            "dance": EmojiInfo.from_url("dance", "https://example.com/dance.png"),
+            "broken": EmojiInfo.from_url("broken", "https://example.com/broken.png"),
+        }
+        progress: list[tuple[str, int]] = []
+
+        with requests_mock.Mocker() as m:
+            m.get("https://example.com/catjam.png", content=png_bytes)
+            m.get("https://example.com/dance.png", content=png_bytes)
+            m.get("https://example.com/broken.png", status_code=404)
+            result = manager.sync_provider(
+                provider, progress_callback=lambda name, i, _total: progress.append((name, i))
+            )
+
+        assert m.call_count == 3
+        assert (result.synced, result.cached, result.skipped) == (2, 1, 1)
+        assert len(result.errors) == 1
+        assert sorted(name for name, _ in progress) == ["broken", "catjam", "dance", "jamcat"]
+        assert [i for _, i in progress] == [1, 2, 3, 4]
+        published = manager.icons_dir / "slack"
+        assert sorted(p.name for p in published.iterdir()) == [
+            "catjam.png",
+            "dance.png",
+            "jamcat.png",
+        ]
+
+    def test_concurrent_providers_share_download_limit(
+        self, manager: SyncManager, png_bytes: bytes, tmp_path: Path
+    ) -> None:
+        """Test that providers synced in parallel stay within one download limit."""
+        providers = []
+        for namespace in ("slack", "work"):
+            provider = MagicMock()
+            provider.TRUSTED_IMAGES = True
+            provider.config.namespace = namespace
+            provider.config.type.value = "slack"
+            provider.fetch_emojis.return_value = {
+                f"e{i}": EmojiInfo.from_url(f"e{i}", f"https://example.com/{namespace}/{i}.png")
+                for i in range(MAX_DOWNLOAD_WORKERS)
+            }
+            providers.append(provider)
+
+        lock = threading.Lock()
+        active = peak = 0
+
+        def download(
+            emoji: EmojiInfo, dest: Path, **_kwargs: object
+        ) -> tuple[Path, int, dict[str, str]]:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            dest.write_bytes(png_bytes)
+            with lock:
+                active -= 1
+            return dest, len(png_bytes), {}
+
+        with (
+            patch.object(manager.downloader, "download_if_modified", side_effect=download),
+            ThreadPoolExecutor(max_workers=2) as executor,
+        ):
+            results = [*executor.map(manager.sync_provider, providers)]
+
+        assert [r.synced for r in results] == [MAX_DOWNLOAD_WORKERS] * 2
+        assert peak <= MAX_DOWNLOAD_WORKERS